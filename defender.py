@@ -10,15 +10,22 @@ retro arcade mechanics implemented in Python.
 
 from __future__ import annotations
 
+import bisect
+import functools
 import math
+import operator
 import random
-from array import array
 from dataclasses import dataclass
-from typing import Callable, Iterable, Optional, Sequence, Union
-import heapq
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy fallbacks are used without it.
+    njit = None
+
 
 # Screen and world configuration ------------------------------------------------
 SCREEN_WIDTH = 1180
@@ -40,6 +47,8 @@ PLAYER_ACCEL = 520
 PLAYER_MAX_SPEED = 520
 PLAYER_CRUISE_SPEED = 120
 ENGINE_DAMPING = 320
+PLAYER_MIN_Y = PLAYFIELD_TOP
+PLAYER_MAX_Y = SCREEN_HEIGHT - 40
 
 LANDER_MIN_ALTITUDE = 120
 LANDER_SPEED = 80
@@ -52,10 +61,14 @@ LANDER_TOP_COLOR = (255, 255, 0)
 LANDER_BODY_COLOR = (0, 255, 0)
 LANDER_LEG_COLOR = (0, 200, 0)
 CAPTURED_HUMAN_COLOR = (255, 0, 255)
+# Lander states; the values index Lander._STATE_HANDLERS.
+LANDER_PATROLLING, LANDER_DESCENDING, LANDER_ASCENDING = range(3)
 
 MUTANT_SPEED = 190
 MUTANT_FIRE_INTERVAL = (1.2, 2.0)
 MUTANT_SHOT_SPEED = 340
+MUTANT_MIN_Y = PLAYFIELD_TOP + 20
+MUTANT_MAX_Y = SCREEN_HEIGHT - 80
 
 HUMAN_COUNT = 10
 HUMAN_SPACING = WORLD_WIDTH // HUMAN_COUNT
@@ -63,27 +76,45 @@ HUMAN_POSITIONS = [i * HUMAN_SPACING + HUMAN_SPACING // 2 for i in range(HUMAN_C
 GRAVITY = 168
 TERMINAL_VELOCITY = 480
 SAFE_LANDING_HEIGHT_RATIO = 1.0 / 3.0
+# Human states; the values index Human._STATE_HANDLERS.
+HUMAN_GROUND, HUMAN_CAPTURED, HUMAN_FALLING, HUMAN_DEAD, HUMAN_CARRIED = range(5)
 
 BOMBER_SPEED = 150
 BOMBER_DROP_INTERVAL = (1.8, 3.6)
+BOMBER_MIN_Y = PLAYFIELD_TOP + 60
+BOMBER_MAX_Y = SCREEN_HEIGHT - 140
 MINE_TTL = 12.0
 
 POD_SPEED = 90
 POD_VERTICAL_RANGE = 90
 POD_SWARMER_COUNT = (4, 6)
+POD_MIN_Y = PLAYFIELD_TOP + 80
+POD_MAX_Y = PLAYFIELD_TOP + 240
 
 SWARMER_SPEED = 240
 SWARMER_JITTER = 80
+SWARMER_MIN_Y = PLAYFIELD_TOP + 20
+SWARMER_MAX_Y = SCREEN_HEIGHT - 140
 
 BAITER_SPEED = 260
 BAITER_FIRE_INTERVAL = (0.9, 1.6)
 BAITER_SPAWN_DELAY = 35.0
 BAITER_STALL_WARNING = 45.0
+BAITER_MIN_Y = PLAYFIELD_TOP + 40
+BAITER_MAX_Y = SCREEN_HEIGHT - 140
 
 GROUND_BASELINE = SCREEN_HEIGHT - 110
 GROUND_PRIMARY_AMPLITUDE = 55
 GROUND_SECONDARY_AMPLITUDE = 28
 
+SPATIAL_HASH_CELL = 64
+# Enemies farther than this from the camera skip firing and cosmetic updates;
+# their shots could not reach the player before expiring.
+ENEMY_ACTIVE_RADIUS = SCREEN_WIDTH * 1.5
+
+# Top-level game modes held in DefenderGame.state.
+GAME_TITLE, GAME_DEMO, GAME_PLAYING, GAME_OVER = range(4)
+
 STAR_LAYERS = 3
 STARS_PER_LAYER = 90
 STAR_COLORS = [(90, 90, 90), (150, 150, 180), (200, 200, 220)]
@@ -94,6 +125,7 @@ THRUSTER_COLORS = [
     (255, 240, 150),
     (200, 120, 255),
 ]
+_N_THRUSTER = len(THRUSTER_COLORS)
 
 POPUP_COLORS = [
     (255, 80, 220),
@@ -101,6 +133,12 @@ POPUP_COLORS = [
     (120, 255, 220),
     (255, 255, 255),
 ]
+# Laser colour cycles; shared by every streak, so they are tuples.
+LASER_DEFAULT_COLORS = ((255, 235, 60), (255, 250, 140), (255, 255, 200), (255, 255, 255))
+PLAYER_BEAM_COLORS = ((255, 235, 60), (255, 250, 140), (255, 255, 210), (255, 255, 255))
+EXPLOSION_SPARK_COLORS = ((255, 200, 120), (255, 160, 80), (255, 240, 200))
+PLAYER_EXPLOSION_COLORS = ((255, 240, 140), (255, 180, 90), (255, 80, 80))
+COLONIST_CRATER_COLORS = ((255, 180, 120), (255, 160, 80), (120, 80, 40))
 DEFAULT_HINT = "Press Enter to launch. WASD/Arrows move, Space fire, Shift warp turn, B smart bomb, H hyperspace, 0 no-death."
 SMART_BOMB_KEY = pygame.K_b
 HYPERSPACE_KEY = pygame.K_h
@@ -113,17 +151,57 @@ DEMO_CONTROL_KEYS = [
     pygame.K_DOWN,
     pygame.K_SPACE,
 ]
+# Half-size of the shot-hash query for the demo pilot: its 180px avoidance
+# radius plus a couple of pixels for screen-rect rounding.
+DEMO_SHOT_AVOID_REACH = 182
+# The demo pilot also fires on a heartbeat: 0.3s on, 0.6s off.
+DEMO_FIRE_CYCLE = 0.9
+# Copied for each demo frame; dict.copy is a C-level clone of the template.
+_DEMO_BLANK_INPUT = dict.fromkeys(DEMO_CONTROL_KEYS, False)
+# Flight controls read every frame; module globals skip the pygame attribute lookup.
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+_K_A = pygame.K_a
+_K_D = pygame.K_d
+_K_W = pygame.K_w
+_K_S = pygame.K_s
+_K_SPACE = pygame.K_SPACE
 HYPERSPACE_LOCK_DURATION = 0.12
 HYPERSPACE_VANISH_TIME = 0.06
 HYPERSPACE_REAPPEAR_DELAY = 0.09
 HYPERSPACE_REAPPEAR_TIME = 0.06
 HYPERSPACE_STABILIZE_TIME = 0.09
+# Hyperspace phases; the values index HYPERSPACE_PHASE_TIMES and Player._HYPERSPACE_EXITS.
+HYPERSPACE_IDLE, HYPERSPACE_VANISH, HYPERSPACE_JUMP, HYPERSPACE_REAPPEAR, HYPERSPACE_STABILIZE = range(5)
+# Per-phase duration and successor, indexed by phase; the idle entries are never read.
+HYPERSPACE_PHASE_TIMES = (
+    0.0, HYPERSPACE_VANISH_TIME, HYPERSPACE_REAPPEAR_DELAY, HYPERSPACE_REAPPEAR_TIME, HYPERSPACE_STABILIZE_TIME,
+)
+HYPERSPACE_NEXT_PHASE = (
+    HYPERSPACE_IDLE, HYPERSPACE_JUMP, HYPERSPACE_REAPPEAR, HYPERSPACE_STABILIZE, HYPERSPACE_IDLE,
+)
 SMART_BOMB_KEY = pygame.K_b
 HYPERSPACE_KEY = pygame.K_h
 HYPERSPACE_COOLDOWN = 5.0
 
 
 # Sound synthesis ----------------------------------------------------------------
+# Single-cycle wavetables indexed by the top bits of a 32-bit phase accumulator.
+WAVETABLE_BITS = 12
+WAVETABLE_SIZE = 1 << WAVETABLE_BITS
+_WAVETABLE_CYCLE = np.arange(WAVETABLE_SIZE) / WAVETABLE_SIZE
+WAVETABLES = {
+    "sine": np.sin(2 * np.pi * _WAVETABLE_CYCLE).astype(np.float32),
+    "square": np.where(_WAVETABLE_CYCLE < 0.5, 1.0, -1.0).astype(np.float32),
+    "saw": (2.0 * _WAVETABLE_CYCLE - 1.0).astype(np.float32),
+    "triangle": (
+        1.0 - 4.0 * np.abs(np.round(_WAVETABLE_CYCLE - 0.25) - (_WAVETABLE_CYCLE - 0.25))
+    ).astype(np.float32),
+}
+
+
 class SoundManager:
     """Builds and plays the retro soundscape entirely via procedural synthesis."""
     def __init__(self):
@@ -138,6 +216,7 @@ class SoundManager:
         self.sounds: dict[str, pygame.mixer.Sound] = {}
         self.looping: dict[str, Optional[pygame.mixer.Channel]] = {}
         self.sample_rate = 44100
+        self.channels = pygame.mixer.get_init()[2]
         self._build_sounds()
 
     def _build_sounds(self):
@@ -155,93 +234,70 @@ class SoundManager:
         self.sounds["hyperspace_in"] = self._arpeggio([700, 1100, 1500], 0.06, 0.35)
         self.sounds["hyperspace_out"] = self._blip(0.1, 0.35)
 
-    def _wave(self, phase: float, waveform: str) -> float:
-        cycle = (phase / (2 * math.pi)) % 1.0
-        if waveform == "square":
-            return 1.0 if cycle < 0.5 else -1.0
-        if waveform == "saw":
-            return 2.0 * cycle - 1.0
-        if waveform == "triangle":
-            return 1.0 - 4.0 * abs(round(cycle - 0.25) - (cycle - 0.25))
-        return math.sin(phase)
+    def _phase_index(self, freq: np.ndarray) -> np.ndarray:
+        """Accumulate a uint32 phase per sample and return it for wavetable lookup."""
+        increments = (np.asarray(freq) * (2**32 / self.sample_rate)).astype(np.uint32)
+        return np.cumsum(increments, dtype=np.uint32)
+
+    def _render(self, freq: np.ndarray, envelope: np.ndarray, waveform: str, *, harmonic: float = 0.0) -> pygame.mixer.Sound:
+        """Run a per-sample frequency curve through a wavetable and shape it with the envelope."""
+        table = WAVETABLES.get(waveform, WAVETABLES["sine"])
+        shift = 32 - WAVETABLE_BITS
+        phase = self._phase_index(freq)
+        value = table[phase >> shift]
+        if harmonic > 0.0:
+            value = (1 - harmonic) * value + harmonic * table[(phase * np.uint32(2)) >> shift]
+        return self._to_sound(value, envelope)
+
+    def _to_sound(self, value: np.ndarray, envelope: np.ndarray) -> pygame.mixer.Sound:
+        shaped = np.clip(value, -1.0, 1.0).astype(np.float32)
+        np.multiply(shaped, envelope, out=shaped)
+        np.multiply(shaped, 32767, out=shaped)
+        samples = np.empty(shaped.size, dtype=np.int16)
+        samples[:] = shaped
+        if self.channels > 1:
+            # sndarray expects one column per mixer channel; duplicate the mono signal.
+            samples = np.repeat(samples[:, np.newaxis], self.channels, axis=1)
+        return pygame.sndarray.make_sound(samples)
+
+    def _progress(self, total_samples: int) -> np.ndarray:
+        return np.arange(total_samples) / max(1, total_samples - 1)
 
     def _chirp(self, start_freq: float, end_freq: float, duration: float, volume: float, *, waveform: str = "square", harmonic: float = 0.0, vibrato: float = 0.0) -> pygame.mixer.Sound:
-        total_samples = int(self.sample_rate * duration)
-        data = array('h')
-        phase = 0.0
-        harmonic_phase = 0.0
-        for i in range(total_samples):
-            progress = i / max(1, total_samples - 1)
-            freq = start_freq + (end_freq - start_freq) * progress
-            if vibrato:
-                freq *= 1.0 + vibrato * math.sin(progress * math.pi * 6)
-            delta = 2 * math.pi * freq / self.sample_rate
-            phase += delta
-            value = self._wave(phase, waveform)
-            if harmonic > 0.0:
-                harmonic_phase += delta * 2
-                value = (1 - harmonic) * value + harmonic * self._wave(harmonic_phase, waveform)
-            envelope = (1 - progress) ** 1.8
-            sample = int(32767 * volume * envelope * max(-1.0, min(1.0, value)))
-            data.append(sample)
-        return pygame.mixer.Sound(buffer=data)
+        progress = self._progress(int(self.sample_rate * duration))
+        freq = start_freq + (end_freq - start_freq) * progress
+        if vibrato:
+            freq *= 1.0 + vibrato * np.sin(progress * math.pi * 6)
+        envelope = volume * (1 - progress) ** 1.8
+        return self._render(freq, envelope, waveform, harmonic=harmonic)
 
     def _explosion(self, duration: float, volume: float) -> pygame.mixer.Sound:
-        total_samples = int(self.sample_rate * duration)
-        data = array('h')
-        phase = 0.0
-        for i in range(total_samples):
-            progress = i / max(1, total_samples - 1)
-            amp = volume * (1 - progress) ** 2
-            phase += 2 * math.pi * (60 + 120 * (1 - progress)) / self.sample_rate
-            rumble = math.sin(phase)
-            noise = random.uniform(-1.0, 1.0)
-            sample = int(32767 * amp * max(-1.0, min(1.0, 0.6 * noise + 0.4 * rumble)))
-            data.append(sample)
-        return pygame.mixer.Sound(buffer=data)
+        progress = self._progress(int(self.sample_rate * duration))
+        phase = self._phase_index(60 + 120 * (1 - progress))
+        rumble = WAVETABLES["sine"][phase >> (32 - WAVETABLE_BITS)]
+        noise = np.random.uniform(-1.0, 1.0, progress.size)
+        envelope = volume * (1 - progress) ** 2
+        return self._to_sound(0.6 * noise + 0.4 * rumble, envelope)
 
     def _arpeggio(self, freqs: list[float], note_time: float, volume: float) -> pygame.mixer.Sound:
         duration = len(freqs) * note_time
-        total_samples = int(self.sample_rate * duration)
-        data = array('h')
-        phase = 0.0
-        for i in range(total_samples):
-            t = i / self.sample_rate
-            index = min(len(freqs) - 1, int(t / note_time))
-            freq = freqs[index]
-            phase += 2 * math.pi * freq / self.sample_rate
-            envelope = max(0.0, 1 - (t / duration))
-            sample = int(32767 * volume * envelope * math.sin(phase))
-            data.append(sample)
-        return pygame.mixer.Sound(buffer=data)
+        t = np.arange(int(self.sample_rate * duration)) / self.sample_rate
+        index = np.minimum(len(freqs) - 1, (t / note_time).astype(int))
+        freq = np.asarray(freqs, dtype=float)[index]
+        envelope = volume * np.maximum(0.0, 1 - (t / duration))
+        return self._render(freq, envelope, "sine")
 
     def _sustain_tone(self, freq: float, duration: float, volume: float, *, vibrato: float = 0.0) -> pygame.mixer.Sound:
-        total_samples = int(self.sample_rate * duration)
-        data = array('h')
-        phase = 0.0
-        for i in range(total_samples):
-            progress = i / max(1, total_samples - 1)
-            mod = math.sin(progress * math.pi * 10) * vibrato
-            effective_freq = freq * (1 + mod * 0.3)
-            phase += 2 * math.pi * effective_freq / self.sample_rate
-            envelope = volume * (0.5 + 0.5 * math.sin(progress * math.pi))
-            sample = int(32767 * envelope * self._wave(phase, "triangle"))
-            data.append(sample)
-        return pygame.mixer.Sound(buffer=data)
+        progress = self._progress(int(self.sample_rate * duration))
+        mod = np.sin(progress * math.pi * 10) * vibrato
+        envelope = volume * (0.5 + 0.5 * np.sin(progress * math.pi))
+        return self._render(freq * (1 + mod * 0.3), envelope, "triangle")
 
     def _blip(self, duration: float, volume: float) -> pygame.mixer.Sound:
-        total_samples = int(self.sample_rate * duration)
-        data = array('h')
-        phase = 0.0
-        for i in range(total_samples):
-            progress = i / max(1, total_samples - 1)
-            freq = 600 + 200 * math.sin(progress * math.pi * 2)
-            phase += 2 * math.pi * freq / self.sample_rate
-            envelope = volume * (1 - progress) ** 2
-            wave = self._wave(phase, "square")
-            sample = int(32767 * envelope * wave)
-            data.append(sample)
-        return pygame.mixer.Sound(buffer=data)
+        progress = self._progress(int(self.sample_rate * duration))
+        freq = 600 + 200 * np.sin(progress * math.pi * 2)
+        envelope = volume * (1 - progress) ** 2
+        return self._render(freq, envelope, "square")
 
     def play(self, key: str):
         if not self.enabled:
@@ -272,59 +328,164 @@ class SoundManager:
 # Helper utilities ----------------------------------------------------------------
 def wrap_position(x: float) -> float:
     """Wrap a world X coordinate into [0, WORLD_WIDTH)."""
-    if x < 0:
-        x += WORLD_WIDTH
-    elif x >= WORLD_WIDTH:
-        x -= WORLD_WIDTH
-    return x
+    return x % WORLD_WIDTH
+
+
+_HALF_WORLD = WORLD_WIDTH * 0.5
+_HALF_SCREEN = SCREEN_WIDTH * 0.5
 
 
 def shortest_offset(a: float, b: float) -> float:
     """Return shortest signed offset between two world X positions."""
-    raw = (a - b) % WORLD_WIDTH
-    if raw > WORLD_WIDTH / 2:
-        raw -= WORLD_WIDTH
-    return raw
+    d = (a - b) % WORLD_WIDTH
+    return d - WORLD_WIDTH if d > _HALF_WORLD else d
 
 
 def world_to_screen(x: float, camera_x: float) -> float:
     """Convert world X to screen X using wrapped offset."""
-    offset = shortest_offset(x, camera_x)
-    return offset + SCREEN_WIDTH / 2
+    d = (x - camera_x) % WORLD_WIDTH
+    return (d - WORLD_WIDTH if d > _HALF_WORLD else d) + _HALF_SCREEN
+
+
+def shortest_offset_batch(xs: np.ndarray, b: float) -> np.ndarray:
+    """Vectorised `shortest_offset` from every X in `xs` to a single position."""
+    return np.mod(xs - b + _HALF_WORLD, WORLD_WIDTH) - _HALF_WORLD
+
+
+def world_to_screen_batch(xs: np.ndarray, camera_x: float) -> np.ndarray:
+    """Vectorised `world_to_screen` for an array of world X positions."""
+    return np.mod(xs - camera_x + _HALF_WORLD, WORLD_WIDTH) - _HALF_WORLD + _HALF_SCREEN
+
+
+def _any_within_loop(pos, x, y, radius, world_width):
+    """Early-exit scan for any (N, 2) row inside a wrapped box around (x, y)."""
+    half = world_width * 0.5
+    for i in range(pos.shape[0]):
+        dx = (pos[i, 0] - x) % world_width
+        if dx > half:
+            dx -= world_width
+        if abs(dx) < radius and abs(pos[i, 1] - y) < radius:
+            return True
+    return False
+
+
+def _any_within_numpy(pos, x, y, radius, world_width):
+    if not len(pos):
+        return False
+    half = world_width * 0.5
+    dx = np.abs(np.mod(pos[:, 0] - x + half, world_width) - half)
+    dy = np.abs(pos[:, 1] - y)
+    return bool(np.any((dx < radius) & (dy < radius)))
+
+
+any_within = njit(cache=True)(_any_within_loop) if njit is not None else _any_within_numpy
+
+
+_BY_POS_X = operator.attrgetter("pos_x")
+
+
+def any_within_sorted(pos: np.ndarray, x: float, y: float, radius: float) -> bool:
+    """`any_within` for rows sorted by X: binary-search the wrapped window and scan only that slice."""
+    xs = pos[:, 0]
+    lo, hi = x - radius, x + radius
+    start, stop = np.searchsorted(xs, (lo, hi))
+    if any_within(pos[start:stop], x, y, radius, float(WORLD_WIDTH)):
+        return True
+    if lo < 0:
+        start = np.searchsorted(xs, lo + WORLD_WIDTH)
+        return any_within(pos[start:], x, y, radius, float(WORLD_WIDTH))
+    if hi > WORLD_WIDTH:
+        stop = np.searchsorted(xs, hi - WORLD_WIDTH)
+        return any_within(pos[:stop], x, y, radius, float(WORLD_WIDTH))
+    return False
 
 
 def clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+    return low if value < low else (high if value > high else value)
+
+
+def _jitter_stream(block: int) -> Iterator[float]:
+    """Yield uniform samples in [-1, 1), drawing them from NumPy a block at a time."""
+    while True:
+        yield from np.random.uniform(-1.0, 1.0, block).tolist()
+
+
+JITTER_BLOCK = 4096
+_JITTER = _jitter_stream(JITTER_BLOCK)
+
+
+def seconds_to_ticks(seconds: float) -> int:
+    """Convert a cosmetic interval to a whole number of frames at the target FPS."""
+    return max(1, round(seconds * FPS))
+
+
+def _sample_terrain(xs: np.ndarray) -> np.ndarray:
+    primary = np.sin(xs * 0.004) * GROUND_PRIMARY_AMPLITUDE
+    secondary = np.sin(xs * 0.0017 + 1.4) * GROUND_SECONDARY_AMPLITUDE
+    return GROUND_BASELINE + primary + secondary
+
+
+# One sample per world pixel plus trailing samples so interpolation never wraps
+# (float modulo can round a tiny negative X up to exactly WORLD_WIDTH).
+TERRAIN_LUT = _sample_terrain(np.arange(WORLD_WIDTH + 2, dtype=np.float64)).astype(np.float32)
+_TERRAIN_SAMPLES = TERRAIN_LUT.tolist()
 
 
 def terrain_height(x: float) -> float:
-    """Compute the rolling landscape height for a given world X."""
+    """Return the rolling landscape height for a given world X from the terrain table."""
     x = x % WORLD_WIDTH
-    primary = math.sin(x * 0.004) * GROUND_PRIMARY_AMPLITUDE
-    secondary = math.sin(x * 0.0017 + 1.4) * GROUND_SECONDARY_AMPLITUDE
-    return GROUND_BASELINE + primary + secondary
+    index = int(x)
+    low = _TERRAIN_SAMPLES[index]
+    return low + (_TERRAIN_SAMPLES[index + 1] - low) * (x - index)
+
+
+_TERRAIN_SAMPLES_F64 = TERRAIN_LUT.astype(np.float64)
+
+
+def terrain_height_batch(xs: np.ndarray) -> np.ndarray:
+    """Vectorised `terrain_height`: one gather from the terrain table for many world X."""
+    xs = np.mod(xs, WORLD_WIDTH)
+    index = xs.astype(np.intp)
+    low = _TERRAIN_SAMPLES_F64[index]
+    return low + (_TERRAIN_SAMPLES_F64[index + 1] - low) * (xs - index)
+
+
+# draw_ground samples the terrain every few screen pixels; the columns and their
+# offsets from the screen centre never change, only the camera does.
+GROUND_SAMPLE_STEP = 4
+_GROUND_SCREEN_XS = np.arange(0, SCREEN_WIDTH + GROUND_SAMPLE_STEP, GROUND_SAMPLE_STEP)
+_GROUND_OFFSETS = _GROUND_SCREEN_XS - SCREEN_WIDTH / 2
 
 
 def surface_from_pattern(pattern: Sequence[str], palette: dict[str, tuple[int, int, int]], pixel_size: int) -> pygame.Surface:
+    """Rasterise a character pattern; identical requests share one cached surface.
+
+    Callers must copy the returned surface before drawing on it.
+    """
+    return _surface_from_pattern(tuple(pattern), tuple(sorted(palette.items())), pixel_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _surface_from_pattern(
+    pattern: tuple[str, ...],
+    palette_items: tuple[tuple[str, tuple[int, int, int]], ...],
+    pixel_size: int,
+) -> pygame.Surface:
     if not pattern:
         raise ValueError("Pattern must contain at least one row.")
     row_length = len(pattern[0])
-    surface = pygame.Surface((row_length * pixel_size, len(pattern) * pixel_size), pygame.SRCALPHA)
-    for row_index, row in enumerate(pattern):
-        if len(row) != row_length:
-            raise ValueError("All pattern rows must have equal length.")
-        for col_index, key in enumerate(row):
-            color = palette.get(key)
-            if not color:
-                continue
-            rect = pygame.Rect(
-                col_index * pixel_size,
-                row_index * pixel_size,
-                pixel_size,
-                pixel_size,
-            )
-            surface.fill(color, rect)
-    return surface
+    if any(len(row) != row_length for row in pattern):
+        raise ValueError("All pattern rows must have equal length.")
+    # Slot 0 is transparent; every coloured palette key maps to the slot after it.
+    slots = {key: index for index, (key, color) in enumerate(palette_items, start=1) if color}
+    palette_rgba = np.array(
+        [(0, 0, 0, 0)] + [(*color[:3], 255) if color else (0, 0, 0, 0) for _, color in palette_items],
+        dtype=np.uint8,
+    )
+    indices = np.array([[slots.get(key, 0) for key in row] for row in pattern], dtype=np.intp)
+    pixels = palette_rgba[indices].repeat(pixel_size, axis=0).repeat(pixel_size, axis=1)
+    size = (row_length * pixel_size, len(pattern) * pixel_size)
+    return pygame.image.frombuffer(pixels.tobytes(), size, "RGBA")
 
 
 def create_human_surface() -> pygame.Surface:
@@ -360,6 +521,7 @@ def create_ship_body() -> pygame.Surface:
     return surf
 
 
+@functools.lru_cache(maxsize=None)
 def create_lander_surface(
     top_color: tuple[int, int, int] = LANDER_TOP_COLOR,
     body_color: tuple[int, int, int] = LANDER_BODY_COLOR,
@@ -387,6 +549,7 @@ def create_lander_surface(
     return surface_from_pattern(pixel_pattern, palette, pixel_size=4)
 
 
+@functools.lru_cache(maxsize=None)
 def create_mutant_surface(colors: tuple[tuple[int, int, int], tuple[int, int, int]]) -> pygame.Surface:
     top_color, body_color = colors
     pixel_pattern = [
@@ -409,10 +572,108 @@ def create_mutant_surface(colors: tuple[tuple[int, int, int], tuple[int, int, in
     return surface_from_pattern(pixel_pattern, palette, pixel_size=4)
 
 
+def create_bomber_surface() -> pygame.Surface:
+    pixel_pattern = [
+        "OOOO",
+        "OYYO",
+        "OYYO",
+        "OOOO",
+    ]
+    palette = {
+        "O": (255, 153, 0),
+        "Y": (255, 255, 0),
+    }
+    return surface_from_pattern(pixel_pattern, palette, pixel_size=6)
+
+
+def create_pod_surface() -> pygame.Surface:
+    pixel_pattern = [
+        "...B...",
+        "..BMB..",
+        ".YMMMY.",
+        "RMMYMMR",
+        ".YMMMY.",
+        "..RMR..",
+        "...R...",
+    ]
+    palette = {
+        "M": (255, 0, 200),
+        "B": (0, 204, 255),
+        "Y": (255, 255, 0),
+        "R": (255, 51, 0),
+    }
+    return surface_from_pattern(pixel_pattern, palette, pixel_size=4)
+
+
+def create_swarmer_surface() -> pygame.Surface:
+    pixel_pattern = [
+        ".R.",
+        "RRR",
+        "RFR",
+        "R.R",
+    ]
+    palette = {
+        "R": (255, 0, 0),
+        "F": (255, 102, 0),
+    }
+    return surface_from_pattern(pixel_pattern, palette, pixel_size=4)
+
+
+def create_baiter_surface() -> pygame.Surface:
+    pixel_pattern = [
+        ".DGGGD.",
+        "DGGGGGD",
+        "GGYYYYG",
+        ".DGGGD.",
+    ]
+    body_color = (0, 255, 0)
+    outline_color = (0, 120, 0)
+    palette = {
+        "D": outline_color,
+        "G": body_color,
+        "Y": (255, 255, 51),
+    }
+    return surface_from_pattern(pixel_pattern, palette, pixel_size=4)
+
+
 HUMAN_BASE_SURFACE = create_human_surface()
+HUMAN_HALF_HEIGHT = HUMAN_BASE_SURFACE.get_height() * 0.5
 SHIP_BODY_SURFACE = create_ship_body()
 SHIP_BODY_FLIPPED = pygame.transform.flip(SHIP_BODY_SURFACE, True, False)
 LIFE_ICON_SURFACE = pygame.transform.scale(SHIP_BODY_SURFACE, (32, 14))
+_AFTERIMAGE_SIZE = (int(SHIP_BODY_SURFACE.get_width() * 1.1), int(SHIP_BODY_SURFACE.get_height() * 1.1))
+HYPERSPACE_AFTERIMAGE_SHIP = pygame.transform.scale(SHIP_BODY_SURFACE, _AFTERIMAGE_SIZE)
+HYPERSPACE_AFTERIMAGE_SHIP_FLIPPED = pygame.transform.scale(SHIP_BODY_FLIPPED, _AFTERIMAGE_SIZE)
+PLAYER_EXHAUST_OFFSETS = ((0, 8), (2, 6), (2, 10), (4, 8))
+
+
+@functools.lru_cache(maxsize=None)
+def create_lives_row(lives: int) -> pygame.Surface:
+    """Reserve-ship icons for the HUD composed into one strip, one per life."""
+    step = LIFE_ICON_SURFACE.get_width() + 4
+    row = pygame.Surface((max(1, lives * step - 4), LIFE_ICON_SURFACE.get_height()), pygame.SRCALPHA)
+    row.blits([(LIFE_ICON_SURFACE, (i * step, 0)) for i in range(lives)], doreturn=False)
+    return row
+
+
+def create_player_frame(direction: int, thruster_color_index: Optional[int] = None) -> pygame.Surface:
+    """Ship facing `direction`, with the exhaust tinted from `thruster_color_index` when thrusting."""
+    surf = (SHIP_BODY_SURFACE if direction == 1 else SHIP_BODY_FLIPPED).copy()
+    if thruster_color_index is not None:
+        for index, (dx, dy) in enumerate(PLAYER_EXHAUST_OFFSETS):
+            x = dx if direction == 1 else surf.get_width() - dx - 2
+            tint = THRUSTER_COLORS[(thruster_color_index + index) % _N_THRUSTER]
+            surf.fill(tint, pygame.Rect(x, dy, 2, 2))
+    return surf
+
+
+# Every ship frame the player can show; only the live ship sets their alpha.
+PLAYER_IDLE_FRAMES = {direction: create_player_frame(direction) for direction in (1, -1)}
+PLAYER_THRUSTER_FRAMES = {
+    (direction, index): create_player_frame(direction, index)
+    for direction in (1, -1)
+    for index in range(_N_THRUSTER)
+}
 LANDER_BASE_SURFACE = create_lander_surface()
 MUTANT_COLOR_ROTATION = [
     ((220, 255, 120), (0, 255, 0)),
@@ -420,6 +681,13 @@ MUTANT_COLOR_ROTATION = [
     ((255, 220, 120), (0, 255, 160)),
     ((240, 255, 150), (60, 255, 80)),
 ]
+_N_MUT = len(MUTANT_COLOR_ROTATION)
+MUTANT_SURFACES = [create_mutant_surface(colors) for colors in MUTANT_COLOR_ROTATION]
+# Shared enemy frames; none of these enemies draw on their image.
+BOMBER_SURFACE = create_bomber_surface()
+POD_SURFACE = create_pod_surface()
+SWARMER_SURFACE = create_swarmer_surface()
+BAITER_SURFACE = create_baiter_surface()
 EMBEDDED_HUMAN_SURFACE = pygame.transform.scale(HUMAN_BASE_SURFACE, (8, 16))
 GROUND_ERUPTION_PARTICLE_COLORS = [
     (255, 200, 120),
@@ -440,73 +708,181 @@ class Timer:
         return self.time_left <= 0
 
 
+class SpatialHash:
+    """Buckets sprites on a uniform grid so broad-phase collision only visits nearby cells.
+
+    Keys come from the sprites' screen rects, which `update_rect` has already
+    resolved relative to the camera, so the world seam never splits a bucket.
+    Buckets are cleared rather than reallocated between frames.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[WorldSprite]] = {}
+
+    def clear(self):
+        for bucket in self.cells.values():
+            bucket.clear()
+
+    def insert(self, sprite: "WorldSprite"):
+        rect = sprite.rect
+        cells = self.cells
+        size = self.cell_size
+        rows = range(rect.top // size, rect.bottom // size + 1)
+        for cx in range(rect.left // size, rect.right // size + 1):
+            for cy in rows:
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def query(self, rect: pygame.Rect) -> list["WorldSprite"]:
+        """Return every sprite sharing a cell with ``rect``; callers still test overlap."""
+        cells = self.cells
+        size = self.cell_size
+        left = rect.left // size
+        right = rect.right // size
+        top = rect.top // size
+        bottom = rect.bottom // size
+        if left == right and top == bottom:
+            return list(cells.get((left, top), ()))
+        found: dict[WorldSprite, None] = {}
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(dict.fromkeys(bucket))
+        return list(found)
+
+
 # Sprite base classes -------------------------------------------------------------
 class WorldSprite(pygame.sprite.Sprite):
     """Base sprite that tracks world-space position with horizontal wraparound."""
+    __slots__ = ("pos_x", "pos_y", "vel_x", "vel_y", "image", "rect")
 
     def __init__(self):
         super().__init__()
-        self.world_pos = pygame.math.Vector2(0, 0)
-        self.velocity = pygame.math.Vector2(0, 0)
+        self.pos_x = 0.0
+        self.pos_y = 0.0
+        self.vel_x = 0.0
+        self.vel_y = 0.0
         # Each subclass must set image/rect.
         self.image: pygame.Surface
         self.rect: pygame.Rect
 
+    @property
+    def world_pos(self) -> pygame.math.Vector2:
+        """Snapshot of the world position; assign pos_x/pos_y to move the sprite."""
+        return pygame.math.Vector2(self.pos_x, self.pos_y)
+
     def update(self, dt: float):
         """Advance the entire simulation by dt seconds."""
-        self.world_pos += self.velocity * dt
-        self.world_pos.x = wrap_position(self.world_pos.x)
+        self.pos_x = (self.pos_x + self.vel_x * dt) % WORLD_WIDTH
+        self.pos_y += self.vel_y * dt
 
     def update_rect(self, camera_x: float):
-        self.rect.centerx = int(world_to_screen(self.world_pos.x, camera_x))
-        self.rect.centery = int(self.world_pos.y)
+        # world_to_screen, inlined: this runs for every sprite in both update and draw.
+        d = (self.pos_x - camera_x) % WORLD_WIDTH
+        if d > _HALF_WORLD:
+            d -= WORLD_WIDTH
+        self.rect.centerx = int(d + _HALF_SCREEN)
+        self.rect.centery = int(self.pos_y)
+
+
+# Laser frames depend only on colour, direction, size and a quantised remaining life.
+LASER_LIFE_BUCKETS = 8
+
+
+@functools.lru_cache(maxsize=512)
+def render_laser_image(
+    color: tuple[int, int, int],
+    direction: int,
+    bucket: int,
+    base_length: int,
+    thickness: int,
+) -> pygame.Surface:
+    """Draw one laser streak frame; results are shared, so callers must not mutate them."""
+    life = (bucket + 1) / LASER_LIFE_BUCKETS
+    alpha = int(70 + 185 * life)
+    length = max(8, int(base_length * (0.15 + 0.85 * life)))
+    start_x = 0 if direction >= 0 else base_length - length
+
+    surface = pygame.Surface((base_length, thickness), pygame.SRCALPHA)
+    core_rect = pygame.Rect(start_x, 0, length, thickness)
+    pygame.draw.rect(surface, (*color, alpha), core_rect)
+
+    inner_color = tuple(min(255, c + 50) for c in color)
+    inner_height = max(1, thickness - 2)
+    inner_rect = pygame.Rect(start_x, (thickness - inner_height) // 2, length, inner_height)
+    pygame.draw.rect(surface, (*inner_color, min(255, alpha + 40)), inner_rect)
+
+    tip_len = max(8, min(length // 6, 24))
+    if direction >= 0:
+        tip_rect = pygame.Rect(start_x + length - tip_len, 0, tip_len, thickness)
+    else:
+        tip_rect = pygame.Rect(start_x, 0, tip_len, thickness)
+    pygame.draw.rect(surface, (255, 255, 255, min(255, alpha + 60)), tip_rect)
+
+    # trailing flicker bands
+    band_len = max(8, length // 5)
+    for i in range(3):
+        blend = 0.7 - i * 0.18
+        band_color = tuple(clamp(int(c * blend + 255 * (1 - blend)), 0, 255) for c in color)
+        if direction >= 0:
+            bx = start_x + max(0, length - tip_len - (i + 1) * band_len)
+        else:
+            bx = start_x + i * band_len
+        band_rect = pygame.Rect(bx, 0, band_len, thickness)
+        pygame.draw.rect(surface, (*band_color, max(60, int(alpha * (0.65 - i * 0.1)))), band_rect)
+    return surface
 
 
 class Laser(WorldSprite):
     """Player laser beam represented as a short-lived streak."""
+    __slots__ = (
+        "direction", "colors", "base_length", "thickness", "anchor", "max_ttl", "ttl",
+        "color_index", "color_ticks", "color_ticks_left", "tip",
+    )
     def __init__(
         self,
         x: float,
         y: float,
-        velocity: pygame.math.Vector2,
+        velocity: Union[pygame.math.Vector2, tuple[float, float]],
         ttl: float = 0.45,
         *,
-        colors: Optional[list[tuple[int, int, int]]] = None,
+        colors: Optional[Sequence[tuple[int, int, int]]] = None,
         length: int = 64,
         thickness: int = 4,
         anchor: str = "center",
         color_interval: float = 0.045,
     ):
         super().__init__()
-        self.direction = 1 if velocity.x >= 0 else -1
-        self.colors = colors or [
-            (255, 235, 60),
-            (255, 250, 140),
-            (255, 255, 200),
-            (255, 255, 255),
-        ]
+        self.direction = 1 if velocity[0] >= 0 else -1
+        self.colors = colors or LASER_DEFAULT_COLORS
         self.base_length = max(6, length)
         self.thickness = max(2, thickness)
         self.anchor = anchor
         self.max_ttl = ttl
         self.ttl = ttl
         self.color_index = 0
-        self.color_interval = color_interval
-        self.color_timer = color_interval
+        self.color_ticks = seconds_to_ticks(color_interval)
+        self.color_ticks_left = self.color_ticks
 
-        self.image = pygame.Surface((self.base_length, self.thickness), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
-        self.world_pos.update(x, y)
-        self.velocity = velocity
+        self.pos_x, self.pos_y = x, y
+        self.vel_x, self.vel_y = velocity
+        # Anchor and direction never change, so resolve the placement once:
+        # 1 puts the tip on the left edge, -1 on the right, 0 centres the beam.
+        self.tip = self.direction if anchor == "tip" else 0
 
         self.update_image()
 
     def update(self, dt: float):
         super().update(dt)
         self.ttl -= dt
-        self.color_timer -= dt
-        if self.color_timer <= 0:
-            self.color_timer = self.color_interval
+        self.color_ticks_left -= 1
+        if self.color_ticks_left <= 0:
+            self.color_ticks_left = self.color_ticks
             self.color_index = (self.color_index + 1) % len(self.colors)
         if self.ttl <= 0:
             self.kill()
@@ -514,70 +890,51 @@ class Laser(WorldSprite):
         self.update_image()
 
     def update_rect(self, camera_x: float):
-        if self.anchor == "tip":
-            screen_x = world_to_screen(self.world_pos.x, camera_x)
-            screen_y = int(self.world_pos.y)
-            if self.direction >= 0:
-                self.rect.midleft = (int(screen_x), screen_y)
-            else:
-                self.rect.midright = (int(screen_x), screen_y)
+        d = (self.pos_x - camera_x) % WORLD_WIDTH
+        if d > _HALF_WORLD:
+            d -= WORLD_WIDTH
+        point = (int(d + _HALF_SCREEN), int(self.pos_y))
+        tip = self.tip
+        if tip > 0:
+            self.rect.midleft = point
+        elif tip < 0:
+            self.rect.midright = point
         else:
-            super().update_rect(camera_x)
+            self.rect.center = point
 
     def update_image(self):
         life = clamp(self.ttl / self.max_ttl, 0.0, 1.0)
-        color = self.colors[self.color_index]
-        alpha = int(70 + 185 * life)
-        length = max(8, int(self.base_length * (0.15 + 0.85 * life)))
-        start_x = 0 if self.direction >= 0 else self.base_length - length
-
-        surface = pygame.Surface((self.base_length, self.thickness), pygame.SRCALPHA)
-        core_rect = pygame.Rect(start_x, 0, length, self.thickness)
-        pygame.draw.rect(surface, (*color, alpha), core_rect)
-
-        inner_color = tuple(min(255, c + 50) for c in color)
-        inner_height = max(1, self.thickness - 2)
-        inner_rect = pygame.Rect(start_x, (self.thickness - inner_height) // 2, length, inner_height)
-        pygame.draw.rect(surface, (*inner_color, min(255, alpha + 40)), inner_rect)
-
-        tip_len = max(8, min(length // 6, 24))
-        if self.direction >= 0:
-            tip_rect = pygame.Rect(start_x + length - tip_len, 0, tip_len, self.thickness)
-        else:
-            tip_rect = pygame.Rect(start_x, 0, tip_len, self.thickness)
-        pygame.draw.rect(surface, (255, 255, 255, min(255, alpha + 60)), tip_rect)
-
-        # trailing flicker bands
-        band_len = max(8, length // 5)
-        for i in range(3):
-            blend = 0.7 - i * 0.18
-            band_color = tuple(clamp(int(c * blend + 255 * (1 - blend)), 0, 255) for c in color)
-            if self.direction >= 0:
-                bx = start_x + max(0, length - tip_len - (i + 1) * band_len)
-            else:
-                bx = start_x + i * band_len
-            band_rect = pygame.Rect(bx, 0, band_len, self.thickness)
-            pygame.draw.rect(surface, (*band_color, max(60, int(alpha * (0.65 - i * 0.1)))), band_rect)
-
-        self.image = surface
+        bucket = min(LASER_LIFE_BUCKETS - 1, int(LASER_LIFE_BUCKETS * life))
+        self.image = render_laser_image(
+            self.colors[self.color_index],
+            self.direction,
+            bucket,
+            self.base_length,
+            self.thickness,
+        )
         self.rect = self.image.get_rect()
 
 
 class EnemyShot(WorldSprite):
-    """Simple projectile fired by enemies towards the player."""
-    def __init__(self, x: float, y: float, velocity: pygame.math.Vector2):
+    """Simple projectile fired by enemies towards the player.
+
+    Motion and lifetime are stepped by the game's ``BulletPool``; the sprite
+    itself only animates and carries the rect used for drawing and collisions.
+    """
+    __slots__ = ("frame_ticks", "frame_ticks_left", "frames", "frame_index")
+    def __init__(self, x: float, y: float, velocity: Union[pygame.math.Vector2, tuple[float, float]]):
         super().__init__()
-        self.world_pos.update(x, y)
-        self.velocity = velocity
-        self.ttl = 2.0
-        self.frame_timer = 0.0
-        self.frame_interval = 0.08
-        self.frames = [self._make_frame(True), self._make_frame(False)]
+        self.pos_x, self.pos_y = x, y
+        self.vel_x, self.vel_y = velocity
+        self.frame_ticks = seconds_to_ticks(0.08)
+        self.frame_ticks_left = self.frame_ticks
+        self.frames = ENEMY_SHOT_FRAMES
         self.frame_index = 0
         self.image = self.frames[self.frame_index]
         self.rect = self.image.get_rect()
 
-    def _make_frame(self, primary: bool) -> pygame.Surface:
+    @staticmethod
+    def _make_frame(primary: bool) -> pygame.Surface:
         surf = pygame.Surface((12, 12), pygame.SRCALPHA)
         color = (255, 255, 160) if primary else (255, 200, 80)
         pygame.draw.rect(surf, color, pygame.Rect(1, 5, 10, 2))
@@ -586,87 +943,80 @@ class EnemyShot(WorldSprite):
         return surf
 
     def update(self, dt: float):
-        super().update(dt)
-        self.ttl -= dt
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_interval:
-            self.frame_timer -= self.frame_interval
+        self.frame_ticks_left -= 1
+        if self.frame_ticks_left <= 0:
+            self.frame_ticks_left = self.frame_ticks
             self.frame_index = (self.frame_index + 1) % len(self.frames)
             center = self.rect.center
             self.image = self.frames[self.frame_index]
             self.rect = self.image.get_rect()
             self.rect.center = center
-        if self.ttl <= 0:
-            self.kill()
+
+
+# Both animation frames are shared by every enemy shot.
+ENEMY_SHOT_FRAMES = (EnemyShot._make_frame(True), EnemyShot._make_frame(False))
 
 
 class ScorePopup(WorldSprite):
+    __slots__ = (
+        "text", "colors", "font", "color_index", "color_ticks", "color_ticks_left", "life", "ttl",
+        "frames",
+    )
     def __init__(self, x: float, y: float, text: str, colors: list[tuple[int, int, int]], font: pygame.font.Font):
         super().__init__()
-        self.world_pos.update(x, y)
-        self.velocity.update(0, -60)
+        self.pos_x, self.pos_y = x, y
+        self.vel_x, self.vel_y = 0.0, -60.0
         self.text = text
         self.colors = colors
         self.font = font
         self.color_index = 0
-        self.color_interval = 0.12
-        self.color_timer = self.color_interval
+        self.color_ticks = seconds_to_ticks(0.12)
+        self.color_ticks_left = self.color_ticks
         self.life = 0.9
         self.ttl = self.life
-        self.image = self.font.render(self.text, True, self.colors[self.color_index])
+        # Rasterise each colour once; frames are owned by this popup so set_alpha is safe.
+        self.frames = [self.font.render(self.text, True, color) for color in self.colors]
+        self.image = self.frames[self.color_index]
         self.image.set_alpha(255)
         self.rect = self.image.get_rect()
 
     def update(self, dt: float):
         super().update(dt)
         self.ttl -= dt
-        self.color_timer -= dt
-        if self.color_timer <= 0:
-            self.color_timer = self.color_interval
+        self.color_ticks_left -= 1
+        if self.color_ticks_left <= 0:
+            self.color_ticks_left = self.color_ticks
             self.color_index = (self.color_index + 1) % len(self.colors)
         if self.ttl <= 0:
             self.kill()
             return
         alpha = clamp(int(255 * (self.ttl / self.life)), 40, 255)
-        color = self.colors[self.color_index]
-        self.image = self.font.render(self.text, True, color)
+        self.image = self.frames[self.color_index]
         self.image.set_alpha(alpha)
         self.rect = self.image.get_rect()
 
 
-class GroundParticle(WorldSprite):
-    def __init__(self, x: float, y: float):
-        super().__init__()
-        angle = random.uniform(-math.pi * 0.4, math.pi * 0.4)
-        speed = random.uniform(160, 340)
-        self.velocity.from_polar((speed, math.degrees(angle)))
-        self.world_pos.update(x, y)
-        size = random.randint(3, 6)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        color = random.choice(GROUND_ERUPTION_PARTICLE_COLORS)
-        pygame.draw.rect(self.image, color, self.image.get_rect())
-        self.rect = self.image.get_rect()
-        self.ttl = GROUND_ERUPTION_TTL + random.uniform(-0.3, 0.3)
-
-    def update(self, dt: float):
-        super().update(dt)
-        self.ttl -= dt
-        self.velocity.y += 220 * dt
-        if self.ttl <= 0:
-            self.kill()
+@functools.lru_cache(maxsize=None)
+def make_radial_alpha(size: int, color: tuple[int, int, int]) -> pygame.Surface:
+    """Build a disc whose alpha rises from the centre to a solid rim, in one upload."""
+    radius = size / 2
+    ys, xs = np.ogrid[:size, :size]
+    distance = np.hypot(xs - size // 2, ys - size // 2)
+    alpha = np.where(distance <= radius, 255 * np.clip(distance / radius, 0.0, 1.0), 0)
+    pixels = np.empty((size, size, 4), dtype=np.uint8)
+    pixels[..., :3] = color
+    pixels[..., 3] = alpha.astype(np.uint8)
+    return pygame.image.frombuffer(pixels.tobytes(), (size, size), "RGBA")
 
 
 class HyperspaceFlash(WorldSprite):
     """Radial flash that accompanies the hyperspace charge-up."""
+    __slots__ = ("duration", "ttl", "invert")
     def __init__(self, x: float, y: float, radius: float = 80.0, invert: bool = False):
         super().__init__()
-        self.world_pos.update(x, y)
-        size = int(radius * 2.2)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        for r in range(size // 2, 0, -4):
-            alpha = int(255 * (r / (size / 2)))
-            color = (255, 234, 160, alpha)
-            pygame.draw.circle(self.image, color, (size // 2, size // 2), r)
+        self.pos_x, self.pos_y = x, y
+        # Copy the shared gradient so the per-flash set_alpha fade stays local.
+        self.image = make_radial_alpha(int(radius * 2.2), (255, 234, 160)).copy()
         self.rect = self.image.get_rect(center=(0, 0))
         self.duration = 0.24
         self.ttl = self.duration
@@ -689,34 +1039,17 @@ class HyperspaceFlash(WorldSprite):
         self.image.set_alpha(alpha)
 
 
-class HyperspaceFragment(WorldSprite):
-    """Short-lived debris fragment used by legacy hyperspace FX."""
-    def __init__(self, x: float, y: float, color: pygame.Color):
-        super().__init__()
-        self.world_pos.update(x, y)
-        angle = random.uniform(0, math.tau)
-        speed = random.uniform(300, 600)
-        self.velocity.from_polar((speed, math.degrees(angle)))
-        size = random.randint(2, 4)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, color, pygame.Rect(0, 0, size, size))
-        self.rect = self.image.get_rect()
-        self.ttl = random.uniform(0.12, 0.18)
-
-    def update(self, dt: float):
-        super().update(dt)
-        self.ttl -= dt
-        self.velocity *= (1 - 6 * dt)
-        if self.ttl <= 0:
-            self.kill()
-
-
 class HyperspaceAfterImage(WorldSprite):
-    """Trailing ghost image rendered while the ship phases out."""
+    """Trailing ghost image rendered while the ship phases out.
+
+    `image` is expected to be pre-scaled (see HYPERSPACE_AFTERIMAGE_SHIP); it is
+    copied so the fade-out alpha stays local to this ghost.
+    """
+    __slots__ = ("ttl",)
     def __init__(self, x: float, y: float, image: pygame.Surface):
         super().__init__()
-        self.world_pos.update(x, y)
-        self.image = pygame.transform.scale(image, (int(image.get_width() * 1.1), int(image.get_height() * 1.1)))
+        self.pos_x, self.pos_y = x, y
+        self.image = image.copy()
         self.image.set_alpha(180)
         self.rect = self.image.get_rect()
         self.ttl = 0.04
@@ -731,14 +1064,36 @@ class HyperspaceAfterImage(WorldSprite):
             self.image.set_alpha(max(0, alpha))
 
 
+ALPHA_LEVELS = 16
+
+
+def build_alpha_levels(image: pygame.Surface) -> list[pygame.Surface]:
+    """Return ALPHA_LEVELS copies of `image` with evenly spaced surface alpha.
+
+    Index a level with `alpha >> 4`; the last level is fully opaque.
+    """
+    step = 255 // (ALPHA_LEVELS - 1)
+    levels = []
+    for index in range(ALPHA_LEVELS):
+        level = image.copy()
+        level.set_alpha(index * step)
+        levels.append(level)
+    return levels
+
+
 class HyperspaceShard(WorldSprite):
-    """Animates a ship fragment along a curved easing path between two points."""
+    """Animates a ship fragment along a curved easing path between two points.
+
+    `frames` is a shared alpha ramp from `build_alpha_levels`, so shards never
+    copy or mutate their surfaces.
+    """
+    __slots__ = ("start", "target", "duration", "elapsed", "fade_in", "frames", "owner", "inward")
     def __init__(
         self,
         start: pygame.math.Vector2,
         target: pygame.math.Vector2,
         duration: float,
-        image: pygame.Surface,
+        frames: Sequence[pygame.Surface],
         *,
         fade_in: bool,
         owner: Optional["Player"] = None,
@@ -750,9 +1105,10 @@ class HyperspaceShard(WorldSprite):
         self.duration = max(0.01, duration)
         self.elapsed = 0.0
         self.fade_in = fade_in
-        self.image = image.copy()
+        self.frames = frames
+        self.image = frames[0] if fade_in else frames[-1]
         self.rect = self.image.get_rect()
-        self.world_pos.update(self.start.x, self.start.y)
+        self.pos_x, self.pos_y = self.start.x, self.start.y
         self.owner = owner
         self.inward = inward
 
@@ -761,16 +1117,20 @@ class HyperspaceShard(WorldSprite):
         progress = clamp(self.elapsed / self.duration, 0.0, 1.0)
         eased = 0.5 - 0.5 * math.cos(progress * math.pi)
         position = self.start.lerp(self.target, eased)
-        self.world_pos.update(position.x, position.y)
+        self.pos_x, self.pos_y = position.x, position.y
         alpha_progress = progress if self.fade_in else (1 - progress)
         alpha = clamp(int(255 * alpha_progress), 0, 255)
-        self.image.set_alpha(alpha)
+        self.image = self.frames[alpha >> 4]
         if self.elapsed >= self.duration:
             self.kill()
             if self.inward and self.owner:
                 self.owner.notify_inbound_shard_complete()
 class Human(WorldSprite):
     """Colonist logic covering abduction, falling, landing, and scoring."""
+    __slots__ = (
+        "game", "base_image", "state", "carrier", "visible", "drop_start_y",
+        "safe_landing_rewarded", "reserved_by",
+    )
     def __init__(self, game: "DefenderGame", x: float):
         super().__init__()
         self.game = game
@@ -778,97 +1138,100 @@ class Human(WorldSprite):
         self.image = self.base_image.copy()
         self.rect = self.image.get_rect()
         ground = terrain_height(x)
-        self.world_pos.update(x, ground - self.rect.height / 2)
-        self.state = "ground"  # ground, captured, falling, dead, carried
+        self.pos_x, self.pos_y = x, ground - HUMAN_HALF_HEIGHT
+        self.state = HUMAN_GROUND
         self.carrier: Optional[WorldSprite] = None
-        self.velocity.update(0, 0)
+        self.vel_x = self.vel_y = 0.0
         self.visible = True
-        self.drop_start_y = self.world_pos.y
+        self.drop_start_y = self.pos_y
         self.safe_landing_rewarded = True
         self.reserved_by: Optional["Lander"] = None
 
     def update(self, dt: float):
-        if self.state == "falling":
-            self.velocity.y += GRAVITY * dt
-            self.velocity.y = min(self.velocity.y, TERMINAL_VELOCITY)
-            self.world_pos.y += self.velocity.y * dt
-            ground = terrain_height(self.world_pos.x)
-            if self.world_pos.y >= ground - self.rect.height / 2:
-                self.world_pos.y = ground - self.rect.height / 2
-                drop_height = max(0.0, ground - self.drop_start_y)
-                full_span = SCREEN_HEIGHT - PLAYFIELD_TOP
-                lethal_height = full_span * SAFE_LANDING_HEIGHT_RATIO
-                catastrophic_height = full_span * 0.75
-                if drop_height >= catastrophic_height:
-                    self.state = "dead"
-                    self.velocity.update(0, 0)
-                    self.visible = False
-                    if self.game:
-                        self.game.explosion(self.world_pos.x, self.world_pos.y)
-                elif drop_height > lethal_height:
-                    self.state = "dead"
-                    self.velocity.update(0, 0)
-                    self.visible = False
-                    if self.game:
-                        self.game.spawn_colonist_crater(self.world_pos.x, self.world_pos.y)
-                else:
-                    self.state = "ground"
-                    self.velocity.update(0, 0)
-                    self.visible = True
-                    if self.game:
-                        self.game.colonist_safe_landing(self)
-        elif self.state == "captured" and self.carrier:
-            self.world_pos.x = self.carrier.world_pos.x
-            offset = (self.carrier.rect.height / 2) + (self.rect.height / 2) - 4
-            self.world_pos.y = self.carrier.world_pos.y + offset
-        elif self.state == "carried" and self.carrier:
-            self.world_pos.x = self.carrier.world_pos.x
-            offset = (self.carrier.rect.height / 2) + (self.rect.height / 2) - 6
-            self.world_pos.y = self.carrier.world_pos.y + offset
-            self.velocity.update(0, 0)
-        elif self.state == "carried":
+        self._STATE_HANDLERS[self.state](self, dt)
+
+    def _update_idle(self, dt: float):
+        pass
+
+    def _update_falling(self, dt: float):
+        self.vel_y += GRAVITY * dt
+        self.vel_y = min(self.vel_y, TERMINAL_VELOCITY)
+        self.pos_y += self.vel_y * dt
+        ground = terrain_height(self.pos_x)
+        if self.pos_y >= ground - HUMAN_HALF_HEIGHT:
+            self.pos_y = ground - HUMAN_HALF_HEIGHT
+            drop_height = max(0.0, ground - self.drop_start_y)
+            full_span = SCREEN_HEIGHT - PLAYFIELD_TOP
+            lethal_height = full_span * SAFE_LANDING_HEIGHT_RATIO
+            catastrophic_height = full_span * 0.75
+            if drop_height >= catastrophic_height:
+                self.state = HUMAN_DEAD
+                self.vel_x = self.vel_y = 0.0
+                self.visible = False
+                if self.game:
+                    self.game.explosion(self.pos_x, self.pos_y)
+            elif drop_height > lethal_height:
+                self.state = HUMAN_DEAD
+                self.vel_x = self.vel_y = 0.0
+                self.visible = False
+                if self.game:
+                    self.game.spawn_colonist_crater(self.pos_x, self.pos_y)
+            else:
+                self.state = HUMAN_GROUND
+                self.vel_x = self.vel_y = 0.0
+                self.visible = True
+                if self.game:
+                    self.game.colonist_safe_landing(self)
+
+    def _update_carried(self, dt: float):
+        # The carrying player positions its captive; only a lost carrier needs handling here.
+        if self.carrier is None:
             self.start_falling()
 
+    # Indexed by HUMAN_GROUND, HUMAN_CAPTURED, HUMAN_FALLING, HUMAN_DEAD, HUMAN_CARRIED.
+    # Captured humans are positioned by their lander, so that state has no work either.
+    _STATE_HANDLERS = (_update_idle, _update_idle, _update_falling, _update_idle, _update_carried)
+
     def start_falling(self):
-        self.state = "falling"
+        self.state = HUMAN_FALLING
         self.carrier = None
-        self.velocity.update(0, 0)
+        self.vel_x = self.vel_y = 0.0
         self.visible = True
-        self.drop_start_y = self.world_pos.y
+        self.drop_start_y = self.pos_y
         self.safe_landing_rewarded = False
         self.release_reservation()
 
     def die(self):
-        if self.state == "dead":
+        if self.state == HUMAN_DEAD:
             return
         carrier = self.carrier
-        self.state = "dead"
+        self.state = HUMAN_DEAD
         self.visible = False
         self.carrier = None
-        self.velocity.update(0, 0)
+        self.vel_x = self.vel_y = 0.0
         self.release_reservation()
         # Notify lander carrying this human so it can resume normal behavior.
         if carrier and hasattr(carrier, "on_captive_removed"):
             carrier.on_captive_removed()
 
     def capture(self, lander: "Lander"):
-        if self.state == "ground":
-            self.state = "captured"
+        if self.state == HUMAN_GROUND:
+            self.state = HUMAN_CAPTURED
             self.carrier = lander
             self.release_reservation(lander)
 
     def attach_to_player(self, player: "Player"):
-        self.state = "carried"
+        self.state = HUMAN_CARRIED
         self.carrier = player
-        self.velocity.update(0, 0)
+        self.vel_x = self.vel_y = 0.0
         self.visible = True
         self.release_reservation()
 
     def place_on_ground(self):
-        ground = terrain_height(self.world_pos.x)
-        self.world_pos.y = ground - self.rect.height / 2
-        self.velocity.update(0, 0)
-        self.state = "ground"
+        ground = terrain_height(self.pos_x)
+        self.pos_y = ground - HUMAN_HALF_HEIGHT
+        self.vel_x = self.vel_y = 0.0
+        self.state = HUMAN_GROUND
         self.visible = True
         self.carrier = None
         self.release_reservation()
@@ -877,7 +1240,7 @@ class Human(WorldSprite):
         self.die()
 
     def reserve_for_lander(self, lander: "Lander") -> bool:
-        if self.state != "ground":
+        if self.state != HUMAN_GROUND:
             return False
         if self.reserved_by not in (None, lander):
             return False
@@ -891,6 +1254,17 @@ class Human(WorldSprite):
 
 class Player(WorldSprite):
     """Handles player input, movement, combat, scoring, and hyperspace effects."""
+    __slots__ = (
+        "game", "base_images", "direction", "thruster_color_index", "thruster_timer",
+        "fire_cooldown", "lives", "score", "invulnerable", "reverse_in_progress",
+        "pending_direction", "lead_duration", "lead_timer", "lead_animating", "lead_start",
+        "lead_target", "lead_current", "velocity_x", "pending_speed", "throttle_active", "opacity",
+        "render_visible", "controls_lock", "demo_input", "hyperspace_state", "hyperspace_timer",
+        "hyperspace_attempts", "hyperspace_target", "afterimage_timer", "lives_awarded",
+        "hyperspace_entry_direction", "hyperspace_entry_lead", "hyperspace_entry_velocity",
+        "hyperspace_entry_pending", "hyperspace_entry_throttle", "hyperspace_inbound_shards",
+        "_image_key", "held_human",
+    )
     def __init__(self, game: "DefenderGame"):
         super().__init__()
         self.game = game
@@ -901,10 +1275,10 @@ class Player(WorldSprite):
         self.direction = 1
         self.thruster_color_index = 0
         self.thruster_timer = 0.0
-        self.image = self.base_images[self.direction].copy()
+        self.image = PLAYER_IDLE_FRAMES[self.direction]
         self.rect = self.image.get_rect()
-        self.exhaust_offsets = [(0, 8), (2, 6), (2, 10), (4, 8)]
-        self.world_pos.update(WORLD_WIDTH / 2, PLAYFIELD_TOP + 180)
+        self._image_key: Optional[tuple] = None
+        self.pos_x, self.pos_y = WORLD_WIDTH / 2, PLAYFIELD_TOP + 180
         self.fire_cooldown = 0.0
         self.lives = 2
         self.score = 0
@@ -925,7 +1299,7 @@ class Player(WorldSprite):
         self.render_visible = True
         self.demo_input: Optional[dict[int, bool]] = None
         self.controls_lock = 0.0
-        self.hyperspace_state = "idle"
+        self.hyperspace_state = HYPERSPACE_IDLE
         self.hyperspace_timer = 0.0
         self.hyperspace_target: Optional[tuple[float, float]] = None
         self.hyperspace_attempts = 0
@@ -940,31 +1314,43 @@ class Player(WorldSprite):
 
     def update(self, dt: float, pressed: Union[Iterable[bool], dict[int, bool]]):
         self.controls_lock = max(0.0, self.controls_lock - dt)
-        input_vector = pygame.math.Vector2(0, 0)
-        def is_down(key: int) -> bool:
-            if isinstance(pressed, dict):
-                return bool(pressed.get(key, False))
-            return bool(pressed[key])
-
-        if is_down(pygame.K_LEFT) or is_down(pygame.K_a):
-            input_vector.x -= 1
-        if is_down(pygame.K_RIGHT) or is_down(pygame.K_d):
-            input_vector.x += 1
-        if is_down(pygame.K_UP) or is_down(pygame.K_w):
-            input_vector.y -= 1
-        if is_down(pygame.K_DOWN) or is_down(pygame.K_s):
-            input_vector.y += 1
-        if input_vector.length_squared() > 0:
-            input_vector = input_vector.normalize()
+        # Read every control once; demo input arrives as a dict, live input as key state.
+        if isinstance(pressed, dict):
+            get = pressed.get
+            left = get(_K_LEFT, False) or get(_K_A, False)
+            right = get(_K_RIGHT, False) or get(_K_D, False)
+            up = get(_K_UP, False) or get(_K_W, False)
+            down = get(_K_DOWN, False) or get(_K_S, False)
+            fire = get(_K_SPACE, False)
+        else:
+            left = pressed[_K_LEFT] or pressed[_K_A]
+            right = pressed[_K_RIGHT] or pressed[_K_D]
+            up = pressed[_K_UP] or pressed[_K_W]
+            down = pressed[_K_DOWN] or pressed[_K_S]
+            fire = pressed[_K_SPACE]
+
+        ix = 0.0
+        iy = 0.0
+        if left:
+            ix -= 1.0
+        if right:
+            ix += 1.0
+        if up:
+            iy -= 1.0
+        if down:
+            iy += 1.0
+        if ix and iy:
+            # Only diagonals need normalising; axis-aligned input is already unit length.
+            ix *= 0.7071067811865476
+            iy *= 0.7071067811865476
 
         if self.controls_lock > 0:
-            input_vector.x = 0
-            input_vector.y = 0
+            ix = iy = 0.0
 
         desired_dir = 0
-        if input_vector.x > 0.1:
+        if ix > 0.1:
             desired_dir = 1
-        elif input_vector.x < -0.1:
+        elif ix < -0.1:
             desired_dir = -1
 
         was_thruster = self.throttle_active
@@ -986,7 +1372,10 @@ class Player(WorldSprite):
                         self.velocity_x = cruise
                 else:
                     self.velocity_x = cruise
-            self.velocity_x = clamp(self.velocity_x, -PLAYER_MAX_SPEED, PLAYER_MAX_SPEED)
+            if self.velocity_x > PLAYER_MAX_SPEED:
+                self.velocity_x = PLAYER_MAX_SPEED
+            elif self.velocity_x < -PLAYER_MAX_SPEED:
+                self.velocity_x = -PLAYER_MAX_SPEED
             if abs(self.velocity_x) > self.pending_speed:
                 self.pending_speed = abs(self.velocity_x)
             effective_vx = self.velocity_x
@@ -1019,39 +1408,44 @@ class Player(WorldSprite):
             if desired_dir and desired_dir != self.direction:
                 self.begin_reverse_traverse(desired_dir)
 
-        if self.hyperspace_state != "idle":
+        if self.hyperspace_state != HYPERSPACE_IDLE:
             effective_vx = 0.0
-            input_vector.y = 0.0
+            iy = 0.0
 
-        self.world_pos.x = wrap_position(self.world_pos.x + effective_vx * dt)
-        self.world_pos.y += input_vector.y * PLAYER_VERTICAL_SPEED * dt
-        lower_bound = PLAYFIELD_TOP
-        self.world_pos.y = clamp(self.world_pos.y, lower_bound, SCREEN_HEIGHT - 40)
+        self.pos_x = (self.pos_x + effective_vx * dt) % WORLD_WIDTH
+        y = self.pos_y + iy * PLAYER_VERTICAL_SPEED * dt
+        if y < PLAYER_MIN_Y:
+            y = PLAYER_MIN_Y
+        elif y > PLAYER_MAX_Y:
+            y = PLAYER_MAX_Y
+        self.pos_y = y
 
         if self.throttle_active:
             self.thruster_timer -= dt
             if self.thruster_timer <= 0:
                 self.thruster_timer = random.uniform(0.05, 0.12)
-                self.thruster_color_index = random.randrange(len(THRUSTER_COLORS))
+                self.thruster_color_index = random.randrange(_N_THRUSTER)
                 self.update_image()
         else:
             self.thruster_timer = 0.0
 
         self.fire_cooldown -= dt
-        if is_down(pygame.K_SPACE) and self.fire_cooldown <= 0:
+        if fire and self.fire_cooldown <= 0:
             self.fire()
             self.fire_cooldown = PLAYER_FIRE_COOLDOWN
 
         if self.invulnerable > 0:
             self.invulnerable -= dt
 
+        self.update_hyperspace(dt)
+
+        # Seat the captive last: a hyperspace jump above may have just moved the ship.
         if self.held_human:
             self.held_human.attach_to_player(self)
-            self.held_human.world_pos.x = wrap_position(self.world_pos.x)
-            offset = (self.rect.height / 2) + (self.held_human.rect.height / 2) - 6
-            self.held_human.world_pos.y = self.world_pos.y + offset
+            self.held_human.pos_x = self.pos_x
+            offset = (self.rect.height / 2) + HUMAN_HALF_HEIGHT - 6
+            self.held_human.pos_y = self.pos_y + offset
 
-        self.update_hyperspace(dt)
         self.check_extra_life()
 
     def check_extra_life(self):
@@ -1067,21 +1461,14 @@ class Player(WorldSprite):
         self.hyperspace_inbound_shards = max(0, self.hyperspace_inbound_shards - 1)
 
     def fire(self):
-        direction_vector = pygame.math.Vector2(self.direction, 0)
-        bullet_velocity = direction_vector * PLAYER_BULLET_SPEED
-        spawn_x = wrap_position(self.world_pos.x + self.direction * (self.rect.width / 2 - 2))
-        beam_colors = [
-            (255, 235, 60),
-            (255, 250, 140),
-            (255, 255, 210),
-            (255, 255, 255),
-        ]
+        bullet_velocity = (self.direction * PLAYER_BULLET_SPEED, 0.0)
+        spawn_x = wrap_position(self.pos_x + self.direction * (self.rect.width / 2 - 2))
         bullet = Laser(
             spawn_x,
-            self.world_pos.y,
+            self.pos_y,
             bullet_velocity,
             ttl=0.48,
-            colors=beam_colors,
+            colors=PLAYER_BEAM_COLORS,
             length=SCREEN_WIDTH,
             thickness=5,
             anchor="tip",
@@ -1098,27 +1485,23 @@ class Player(WorldSprite):
         if self.invulnerable > 0:
             return
         self.drop_carried_human(force_fall=True)
-        self.game.spawn_player_explosion(self.world_pos.x, self.world_pos.y)
+        self.game.spawn_player_explosion(self.pos_x, self.pos_y)
         self.game.begin_player_respawn_delay()
 
     def update_image(self):
-        center = self.rect.center if self.rect else (0, 0)
-        base = self.base_images[self.direction]
-        self.image = base.copy()
-        if self.throttle_active:
-            if self.direction == 1:
-                for index, (dx, dy) in enumerate(self.exhaust_offsets):
-                    tint = THRUSTER_COLORS[(self.thruster_color_index + index) % len(THRUSTER_COLORS)]
-                    self.image.fill(tint, pygame.Rect(dx, dy, 2, 2))
-            else:
-                for index, (dx, dy) in enumerate(self.exhaust_offsets):
-                    mirror_x = self.image.get_width() - dx - 2
-                    tint = THRUSTER_COLORS[(self.thruster_color_index + index) % len(THRUSTER_COLORS)]
-                    self.image.fill(tint, pygame.Rect(mirror_x, dy, 2, 2))
-        self.rect = self.image.get_rect()
-        self.rect.center = center
         alpha = self.opacity if self.render_visible else 0
-        self.image.set_alpha(alpha)
+        key = (self.direction, self.thruster_color_index if self.throttle_active else -1, alpha)
+        if key == self._image_key:
+            return
+        self._image_key = key
+        if self.throttle_active:
+            image = PLAYER_THRUSTER_FRAMES[(self.direction, self.thruster_color_index)]
+        else:
+            image = PLAYER_IDLE_FRAMES[self.direction]
+        # Frames are shared across ship instances, so alpha is applied whenever the key
+        # changes. Every frame shares the body's size, so the existing rect stays valid.
+        image.set_alpha(alpha)
+        self.image = image
 
     def pickup_human(self, human: Human):
         if self.held_human:
@@ -1132,11 +1515,11 @@ class Player(WorldSprite):
         human = self.held_human
         self.held_human = None
         if force_fall:
-            human.world_pos.x = wrap_position(self.world_pos.x)
-            human.world_pos.y = self.world_pos.y + self.rect.height
+            human.pos_x = self.pos_x
+            human.pos_y = self.pos_y + self.rect.height
             human.start_falling()
         else:
-            human.world_pos.x = wrap_position(self.world_pos.x)
+            human.pos_x = self.pos_x
             human.carrier = None
             human.start_falling()
 
@@ -1145,7 +1528,7 @@ class Player(WorldSprite):
             return None
         human = self.held_human
         self.held_human = None
-        human.world_pos.x = wrap_position(self.world_pos.x)
+        human.pos_x = self.pos_x
         human.carrier = None
         human.place_on_ground()
         return human
@@ -1174,7 +1557,7 @@ class Player(WorldSprite):
     # Hyperspace orchestrates a multi-phase animation where the ship shards fly outward,
     # the player jumps to a new location, and the shards fly back before control resumes.
     def start_hyperspace(self):
-        if self.hyperspace_state != "idle" or self.game.hyperspace_cooldown > 0:
+        if self.hyperspace_state != HYPERSPACE_IDLE or self.game.hyperspace_cooldown > 0:
             return
         self.hyperspace_entry_direction = self.direction
         self.hyperspace_entry_lead = self.lead_current
@@ -1184,7 +1567,7 @@ class Player(WorldSprite):
         self.hyperspace_inbound_shards = 0
         self.game.sfx.play("hyperspace_in")
         self.game.sfx.play("hyperspace_out")
-        self.hyperspace_state = "vanish"
+        self.hyperspace_state = HYPERSPACE_VANISH
         self.hyperspace_timer = 0.0
         self.controls_lock = max(self.controls_lock, HYPERSPACE_LOCK_DURATION)
         self.throttle_active = False
@@ -1194,70 +1577,75 @@ class Player(WorldSprite):
     # The hyperspace state machine drives the vanish → jump → reappear → stabilize flow.
     # Visibility is suppressed until all returning shards notify completion.
     def update_hyperspace(self, dt: float):
-        if self.hyperspace_state == "idle":
+        state = self.hyperspace_state
+        if state == HYPERSPACE_IDLE:
             if self.opacity < 255:
                 self.opacity = min(255, self.opacity + int(800 * dt))
                 self.update_image()
             return
 
         self.hyperspace_timer += dt
-
-        if self.hyperspace_state == "vanish":
+        if state == HYPERSPACE_VANISH:
             progress = clamp(self.hyperspace_timer / HYPERSPACE_VANISH_TIME, 0.0, 1.0)
             new_opacity = int(255 * (1 - progress))
             if new_opacity != self.opacity:
                 self.opacity = new_opacity
                 self.update_image()
-            if self.hyperspace_timer >= HYPERSPACE_VANISH_TIME:
-                self.render_visible = False
-                self.opacity = 0
-                self.update_image()
-                self.hyperspace_state = "jump"
-                self.hyperspace_timer = 0.0
-                self.game.perform_hyperspace_jump(self)
-                self.velocity_x = 0.0
-                self.pending_speed = 0.0
-                self.throttle_active = False
-
-        elif self.hyperspace_state == "jump":
-            if self.hyperspace_timer >= HYPERSPACE_REAPPEAR_DELAY:
-                self.hyperspace_state = "reappear"
-                self.hyperspace_timer = 0.0
-                self.game.spawn_hyperspace_shards(self, outward=False)
-                self.game.sfx.play("hyperspace_out")
-
-        elif self.hyperspace_state == "reappear":
+        elif state == HYPERSPACE_REAPPEAR:
             self.render_visible = False
             self.opacity = 0
-            if self.hyperspace_timer >= HYPERSPACE_REAPPEAR_TIME and self.hyperspace_inbound_shards == 0:
-                self.hyperspace_state = "stabilize"
-                self.hyperspace_timer = 0.0
-                self.direction = self.hyperspace_entry_direction
-                self.update_image()
+            # Hold the reappear phase until every inbound shard has landed.
+            if self.hyperspace_inbound_shards:
+                return
 
-        elif self.hyperspace_state == "stabilize":
-            if self.hyperspace_timer >= HYPERSPACE_STABILIZE_TIME:
-                self.hyperspace_state = "idle"
-                self.hyperspace_timer = 0.0
-                self.render_visible = True
-                self.opacity = 255
-                self.update_image()
-                self.velocity_x = self.hyperspace_entry_velocity
-                self.pending_speed = max(abs(self.velocity_x), PLAYER_CRUISE_SPEED)
-                self.throttle_active = self.hyperspace_entry_throttle
-                if self.throttle_active:
-                    self.game.sfx.loop("engine")
-                self.game.hyperspace_cooldown = HYPERSPACE_COOLDOWN
+        if self.hyperspace_timer >= HYPERSPACE_PHASE_TIMES[state]:
+            self.hyperspace_state = HYPERSPACE_NEXT_PHASE[state]
+            self.hyperspace_timer = 0.0
+            self._HYPERSPACE_EXITS[state](self)
+
+    def _end_vanish(self):
+        self.render_visible = False
+        self.opacity = 0
+        self.update_image()
+        self.game.perform_hyperspace_jump(self)
+        self.velocity_x = 0.0
+        self.pending_speed = 0.0
+        self.throttle_active = False
+
+    def _end_jump(self):
+        self.game.spawn_hyperspace_shards(self, outward=False)
+        self.game.sfx.play("hyperspace_out")
+
+    def _end_reappear(self):
+        self.direction = self.hyperspace_entry_direction
+        self.update_image()
+
+    def _end_stabilize(self):
+        self.render_visible = True
+        self.opacity = 255
+        self.update_image()
+        self.velocity_x = self.hyperspace_entry_velocity
+        self.pending_speed = max(abs(self.velocity_x), PLAYER_CRUISE_SPEED)
+        self.throttle_active = self.hyperspace_entry_throttle
+        if self.throttle_active:
+            self.game.sfx.loop("engine")
+        self.game.hyperspace_cooldown = HYPERSPACE_COOLDOWN
+
+    # Run when a phase's time is up, indexed by the phase being left.
+    _HYPERSPACE_EXITS = (None, _end_vanish, _end_jump, _end_reappear, _end_stabilize)
 
 
 class Enemy(WorldSprite):
     """Base enemy behaviour shared across all alien archetypes."""
+    __slots__ = ("game", "health", "points", "fire_timer", "active")
     def __init__(self, game: "DefenderGame"):
         super().__init__()
         self.game = game
         self.health = 1
         self.points = 0
         self.fire_timer = random.uniform(*LANDER_FIRE_INTERVAL)
+        # Refreshed each tick by DefenderGame.refresh_enemy_activity().
+        self.active = True
 
     def take_damage(self, amount: int):
         self.health -= amount
@@ -1275,16 +1663,16 @@ class Enemy(WorldSprite):
 
 class Lander(Enemy):
     """Abducts colonists, mutates into mutants, and shoots at the player."""
+    __slots__ = ("home_altitude", "patrol_direction", "state", "target")
     def __init__(self, game: "DefenderGame", x: float):
         super().__init__(game)
-        self.base_image = LANDER_BASE_SURFACE
-        self.image = self.base_image.copy()
+        self.image = LANDER_BASE_SURFACE
         self.rect = self.image.get_rect()
-        self.world_pos.update(x, random.uniform(PLAYFIELD_TOP + 40, PLAYFIELD_TOP + 160))
-        self.home_altitude = self.world_pos.y
+        self.pos_x, self.pos_y = x, random.uniform(PLAYFIELD_TOP + 40, PLAYFIELD_TOP + 160)
+        self.home_altitude = self.pos_y
         self.patrol_direction = random.choice([-1, 1])
         self.target: Optional[Human] = None
-        self.state = "patrolling"  # patrolling, descending, ascending
+        self.state = LANDER_PATROLLING
         self.health = 1
         self.points = 150
         self.fire_timer = random.uniform(*LANDER_FIRE_INTERVAL)
@@ -1292,107 +1680,141 @@ class Lander(Enemy):
     def update(self, dt: float):
         super().update(dt)
 
-        if self.target and self.target.state == "dead":
+        if self.target and self.target.state == HUMAN_DEAD:
             self.on_captive_removed()
 
-        if self.state == "patrolling":
-            if self.target and (
-                self.target.state != "ground"
-                or self.target.carrier not in (None, self)
-                or self.target.reserved_by not in (None, self)
-            ):
-                self.release_target()
-            if not self.target:
-                candidate = self.find_target()
-                if candidate and candidate.reserve_for_lander(self):
-                    self.target = candidate
-            if self.target:
-                direction = math.copysign(1, shortest_offset(self.target.world_pos.x, self.world_pos.x))
-                self.world_pos.x = wrap_position(self.world_pos.x + direction * LANDER_SPEED * dt)
-                if abs(shortest_offset(self.target.world_pos.x, self.world_pos.x)) < 6:
-                    self.state = "descending"
-            else:
-                if random.random() < 0.02:
-                    self.patrol_direction *= -1
-                self.world_pos.x = wrap_position(
-                    self.world_pos.x + self.patrol_direction * LANDER_SPEED * 0.4 * dt
-                )
-                target_altitude = clamp(self.home_altitude, PLAYFIELD_TOP + 40, PLAYFIELD_TOP + 160)
-                delta = target_altitude - self.world_pos.y
-                self.world_pos.y += clamp(delta, -abs(LANDER_DESCENT_SPEED * dt), abs(LANDER_ASCENT_SPEED * dt))
-        elif self.state == "descending":
-            self.world_pos.y += LANDER_DESCENT_SPEED * dt
-            if self.target:
-                hover = self.target.world_pos.y - (self.rect.height / 2 + self.target.rect.height / 2 - 6)
-                if self.world_pos.y >= hover:
-                    self.world_pos.y = hover
-                    self.state = "ascending"
-                    self.target.capture(self)
-        elif self.state == "ascending":
-            self.world_pos.y -= LANDER_ASCENT_SPEED * dt
-            self.world_pos.x = wrap_position(self.world_pos.x + random.uniform(-40, 40) * dt)
-            if self.world_pos.y <= max(LANDER_MIN_ALTITUDE, PLAYFIELD_TOP):
-                self.mutate()
-                return
+        if self._STATE_HANDLERS[self.state](self, dt):
+            return
+
+        target = self.target
+        if target is not None and target.carrier is self:
+            target.pos_x = self.pos_x
+            target.pos_y = self.pos_y + self.rect.height / 2 + HUMAN_HALF_HEIGHT - 4
+            # The human may already have had its rect refreshed this tick.
+            target.update_rect(self.game.camera_x)
 
         self.fire_timer -= dt
         if self.fire_timer <= 0:
             self.fire_timer = random.uniform(*LANDER_FIRE_INTERVAL)
-            self.fire()
+            if self.active:
+                self.fire()
+
+    def _update_patrolling(self, dt: float):
+        if self.target and (
+            self.target.state != HUMAN_GROUND
+            or self.target.carrier not in (None, self)
+            or self.target.reserved_by not in (None, self)
+        ):
+            self.release_target()
+        if not self.target:
+            candidate = self.find_target()
+            if candidate and candidate.reserve_for_lander(self):
+                self.target = candidate
+        if self.target:
+            target_x = self.target.pos_x
+            # Wrapped offsets in [0, WORLD_WIDTH): past the halfway point the target is behind us.
+            offset = (target_x - self.pos_x) % WORLD_WIDTH
+            direction = 1.0 if offset <= _HALF_WORLD else -1.0
+            self.pos_x = (self.pos_x + direction * LANDER_SPEED * dt) % WORLD_WIDTH
+            offset = (target_x - self.pos_x) % WORLD_WIDTH
+            if offset < 6 or offset > WORLD_WIDTH - 6:
+                self.state = LANDER_DESCENDING
+        else:
+            if random.random() < 0.02:
+                self.patrol_direction *= -1
+            self.pos_x = (self.pos_x + self.patrol_direction * LANDER_SPEED * 0.4 * dt) % WORLD_WIDTH
+            target_altitude = clamp(self.home_altitude, PLAYFIELD_TOP + 40, PLAYFIELD_TOP + 160)
+            delta = target_altitude - self.pos_y
+            low = -abs(LANDER_DESCENT_SPEED * dt)
+            high = abs(LANDER_ASCENT_SPEED * dt)
+            self.pos_y += low if delta < low else (high if delta > high else delta)
+
+    def _update_descending(self, dt: float):
+        self.pos_y += LANDER_DESCENT_SPEED * dt
+        if self.target:
+            hover = self.target.pos_y - (self.rect.height / 2 + HUMAN_HALF_HEIGHT - 6)
+            if self.pos_y >= hover:
+                self.pos_y = hover
+                self.state = LANDER_ASCENDING
+                self.target.capture(self)
+
+    def _update_ascending(self, dt: float):
+        self.pos_y -= LANDER_ASCENT_SPEED * dt
+        self.pos_x = (self.pos_x + 40 * next(_JITTER) * dt) % WORLD_WIDTH
+        if self.pos_y <= max(LANDER_MIN_ALTITUDE, PLAYFIELD_TOP):
+            self.mutate()
+            return True
+        return False
 
-        self.update_image()
+    # Indexed by LANDER_PATROLLING, LANDER_DESCENDING, LANDER_ASCENDING. A handler
+    # returns True once the lander has been replaced and must stop updating.
+    _STATE_HANDLERS = (_update_patrolling, _update_descending, _update_ascending)
 
     def find_target(self) -> Optional[Human]:
-        candidates = [
-            h
-            for h in self.game.humans
-            if h.state == "ground" and h.carrier is None and h.reserved_by in (None, self)
-        ]
-        if not candidates:
+        """Return the nearest unclaimed grounded human using the game's sorted index."""
+        humans = self.game.ground_humans
+        count = len(humans)
+        if not count:
             return None
-        return min(
-            candidates,
-            key=lambda h: abs(shortest_offset(h.world_pos.x, self.world_pos.x)),
-        )
+        xs = self.game.ground_human_xs
+        x = self.pos_x
+        ahead = bisect.bisect_left(xs, x)
+        behind = ahead - 1
+        best = None
+        best_distance = WORLD_WIDTH
+        # Walk outward both ways round the world until neither side can beat the best match.
+        for _ in range(count):
+            ahead_index = ahead % count
+            behind_index = behind % count
+            if (
+                (xs[ahead_index] - x) % WORLD_WIDTH >= best_distance
+                and (x - xs[behind_index]) % WORLD_WIDTH >= best_distance
+            ):
+                break
+            for index in (ahead_index, behind_index):
+                human = humans[index]
+                distance = abs(shortest_offset(xs[index], x))
+                if (
+                    distance < best_distance
+                    and human.state == HUMAN_GROUND
+                    and human.carrier is None
+                    and human.reserved_by in (None, self)
+                ):
+                    best = human
+                    best_distance = distance
+            ahead += 1
+            behind -= 1
+        return best
 
     def fire(self):
         if not self.game.player:
             return
-        to_player = pygame.math.Vector2(
-            shortest_offset(self.game.player.world_pos.x, self.world_pos.x),
-            self.game.player.world_pos.y - self.world_pos.y,
-        )
-        if to_player.length_squared() == 0:
+        player = self.game.player
+        dx = shortest_offset(player.pos_x, self.pos_x)
+        dy = player.pos_y - self.pos_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
             return
-        direction = to_player.normalize()
-        shot = EnemyShot(
-            self.world_pos.x,
-            self.world_pos.y,
-            direction * LANDER_SHOT_SPEED,
-        )
-        self.game.enemy_shots.add(shot)
-        self.game.all_sprites.add(shot)
+        scale = LANDER_SHOT_SPEED / distance
+        self.game.spawn_enemy_shot(self.pos_x, self.pos_y, dx * scale, dy * scale)
         self.game.sfx.play("enemy_fire")
 
     def mutate(self):
         if self.target:
             self.target.kill()
-        mutant = Mutant(self.game, self.world_pos.x, self.world_pos.y)
+        mutant = Mutant(self.game, self.pos_x, self.pos_y)
         self.kill()
         self.game.spawned_mutant(mutant)
         self.game.sfx.play("mutate")
 
     def destroy(self):
-        if self.target and self.target.state == "captured":
+        if self.target and self.target.state == HUMAN_CAPTURED:
             self.target.start_falling()
             if self.game.player:
                 self.game.player.score += 350
         self.release_target()
         super().destroy()
 
-    def update_image(self):
-        self.image = self.base_image.copy()
-
     def release_target(self):
         if self.target:
             self.target.release_reservation(self)
@@ -1400,21 +1822,22 @@ class Lander(Enemy):
 
     def on_captive_removed(self):
         self.release_target()
-        if self.state in ("descending", "ascending"):
-            self.state = "patrolling"
-        self.home_altitude = clamp(self.world_pos.y, PLAYFIELD_TOP + 40, PLAYFIELD_TOP + 160)
+        if self.state in (LANDER_DESCENDING, LANDER_ASCENDING):
+            self.state = LANDER_PATROLLING
+        self.home_altitude = clamp(self.pos_y, PLAYFIELD_TOP + 40, PLAYFIELD_TOP + 160)
         self.patrol_direction = random.choice([-1, 1])
 
 
 class Mutant(Enemy):
+    __slots__ = ("palette_index", "palette_timer", "base_image")
     def __init__(self, game: "DefenderGame", x: float, y: float):
         super().__init__(game)
-        self.palette_index = random.randrange(len(MUTANT_COLOR_ROTATION))
+        self.palette_index = random.randrange(_N_MUT)
         self.palette_timer = 0.0
-        self.base_image = create_mutant_surface(MUTANT_COLOR_ROTATION[self.palette_index])
-        self.image = self.base_image.copy()
+        self.base_image = MUTANT_SURFACES[self.palette_index]
+        self.image = self.base_image
         self.rect = self.image.get_rect()
-        self.world_pos.update(x, y)
+        self.pos_x, self.pos_y = x, y
         self.health = 2
         self.points = 300
         self.fire_timer = random.uniform(*MUTANT_FIRE_INTERVAL)
@@ -1422,70 +1845,73 @@ class Mutant(Enemy):
 
     def update(self, dt: float):
         super().update(dt)
-        if not self.game.player:
+        player = self.game.player
+        if not player:
             return
-        to_player = pygame.math.Vector2(
-            shortest_offset(self.game.player.world_pos.x, self.world_pos.x),
-            self.game.player.world_pos.y - self.world_pos.y,
-        )
-        if to_player.length_squared() > 0:
-            direction = to_player.normalize()
-            self.world_pos.x = wrap_position(self.world_pos.x + direction.x * MUTANT_SPEED * dt)
-            self.world_pos.y += direction.y * MUTANT_SPEED * dt
-            self.world_pos.y = clamp(self.world_pos.y, PLAYFIELD_TOP + 20, SCREEN_HEIGHT - 80)
+        dx = shortest_offset(player.pos_x, self.pos_x)
+        dy = player.pos_y - self.pos_y
+        distance = math.hypot(dx, dy)
+        if distance:
+            step = MUTANT_SPEED * dt / distance
+            self.pos_x = (self.pos_x + dx * step) % WORLD_WIDTH
+            y = self.pos_y + dy * step
+            if y < MUTANT_MIN_Y:
+                y = MUTANT_MIN_Y
+            elif y > MUTANT_MAX_Y:
+                y = MUTANT_MAX_Y
+            self.pos_y = y
 
         self.fire_timer -= dt
         if self.fire_timer <= 0:
             self.fire_timer = random.uniform(*MUTANT_FIRE_INTERVAL)
-            self.fire()
+            if self.active:
+                self.fire()
 
         self.palette_timer -= dt
         if self.palette_timer <= 0:
             self.palette_timer = 0.12
-            self.palette_index = (self.palette_index + 1) % len(MUTANT_COLOR_ROTATION)
+            self.palette_index = (self.palette_index + 1) % _N_MUT
             self.update_image()
 
     def fire(self):
-        to_player = pygame.math.Vector2(
-            shortest_offset(self.game.player.world_pos.x, self.world_pos.x),
-            self.game.player.world_pos.y - self.world_pos.y,
-        )
-        if to_player.length_squared() == 0:
+        player = self.game.player
+        dx = shortest_offset(player.pos_x, self.pos_x)
+        dy = player.pos_y - self.pos_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
             return
-        direction = to_player.normalize()
-        shot = EnemyShot(
-            self.world_pos.x,
-            self.world_pos.y,
-            direction * MUTANT_SHOT_SPEED,
-        )
-        self.game.enemy_shots.add(shot)
-        self.game.all_sprites.add(shot)
+        scale = MUTANT_SHOT_SPEED / distance
+        self.game.spawn_enemy_shot(self.pos_x, self.pos_y, dx * scale, dy * scale)
         self.game.sfx.play("enemy_fire")
 
     def embed_human(self):
         pass
 
     def update_image(self):
-        self.base_image = create_mutant_surface(MUTANT_COLOR_ROTATION[self.palette_index])
-        center = self.rect.center if hasattr(self, "rect") else (0, 0)
-        self.image = self.base_image.copy()
-        self.rect = self.image.get_rect()
-        self.rect.center = center
+        # All mutant palettes share one size, so the rect can stay as it is.
+        self.base_image = MUTANT_SURFACES[self.palette_index]
+        self.image = self.base_image
 
 
 class Mine(WorldSprite):
+    __slots__ = ("game", "ttl")
     def __init__(self, game: "DefenderGame", x: float, y: float):
         super().__init__()
         self.game = game
-        self.world_pos.update(x, y)
-        self.velocity.update(0, 0)
-        self.image = pygame.Surface((12, 12), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (255, 220, 40), pygame.Rect(0, 5, 12, 2))
-        pygame.draw.rect(self.image, (255, 220, 40), pygame.Rect(5, 0, 2, 12))
-        pygame.draw.rect(self.image, (255, 255, 255), pygame.Rect(3, 3, 6, 6))
+        self.pos_x, self.pos_y = x, y
+        self.vel_x = self.vel_y = 0.0
+        self.image = MINE_SURFACE
         self.rect = self.image.get_rect()
         self.ttl = MINE_TTL
 
+    @staticmethod
+    def _make_image() -> pygame.Surface:
+        surf = pygame.Surface((12, 12), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (255, 220, 40), pygame.Rect(0, 5, 12, 2))
+        pygame.draw.rect(surf, (255, 220, 40), pygame.Rect(5, 0, 2, 12))
+        pygame.draw.rect(surf, (255, 255, 255), pygame.Rect(3, 3, 6, 6))
+        return surf
+
     def update(self, dt: float):
         super().update(dt)
         self.ttl -= dt
@@ -1493,198 +1919,432 @@ class Mine(WorldSprite):
             self.kill()
 
 
+# Every mine shares one frame.
+MINE_SURFACE = Mine._make_image()
+
+
 class Bomber(Enemy):
     """Horizontally drifting bomber that drops explosive mines."""
+    __slots__ = ("direction", "drop_timer")
     def __init__(self, game: "DefenderGame", x: float):
         super().__init__(game)
-        pixel_pattern = [
-            "OOOO",
-            "OYYO",
-            "OYYO",
-            "OOOO",
-        ]
-        palette = {
-            "O": (255, 153, 0),
-            "Y": (255, 255, 0),
-        }
-        self.image = surface_from_pattern(pixel_pattern, palette, pixel_size=6)
+        self.image = BOMBER_SURFACE
         self.rect = self.image.get_rect()
-        self.world_pos.update(x, random.uniform(PLAYFIELD_TOP + 80, PLAYFIELD_TOP + 180))
+        self.pos_x, self.pos_y = x, random.uniform(PLAYFIELD_TOP + 80, PLAYFIELD_TOP + 180)
         self.direction = random.choice([-1, 1])
         self.drop_timer = random.uniform(*BOMBER_DROP_INTERVAL)
         self.points = 250
 
     def update(self, dt: float):
         super().update(dt)
-        self.world_pos.x = wrap_position(self.world_pos.x + self.direction * BOMBER_SPEED * dt)
-        oscillation = math.sin(pygame.time.get_ticks() * 0.002) * 20 * dt
-        self.world_pos.y = clamp(self.world_pos.y + oscillation, PLAYFIELD_TOP + 60, SCREEN_HEIGHT - 140)
+        self.pos_x = (self.pos_x + self.direction * BOMBER_SPEED * dt) % WORLD_WIDTH
+        y = self.pos_y + self.game.tick_sin * 20 * dt
+        if y < BOMBER_MIN_Y:
+            y = BOMBER_MIN_Y
+        elif y > BOMBER_MAX_Y:
+            y = BOMBER_MAX_Y
+        self.pos_y = y
         self.drop_timer -= dt
         if self.drop_timer <= 0:
             self.drop_timer = random.uniform(*BOMBER_DROP_INTERVAL)
-            self.game.spawn_mine(self.world_pos.x, self.world_pos.y + 20)
+            self.game.spawn_mine(self.pos_x, self.pos_y + 20)
 
 
 class Pod(Enemy):
     """Drifting energy pod that bursts into swarmer drones when destroyed."""
+    __slots__ = ()
     def __init__(self, game: "DefenderGame", x: float):
         super().__init__(game)
-        pixel_pattern = [
-            "...B...",
-            "..BMB..",
-            ".YMMMY.",
-            "RMMYMMR",
-            ".YMMMY.",
-            "..RMR..",
-            "...R...",
-        ]
-        palette = {
-            "M": (255, 0, 200),
-            "B": (0, 204, 255),
-            "Y": (255, 255, 0),
-            "R": (255, 51, 0),
-        }
-        self.image = surface_from_pattern(pixel_pattern, palette, pixel_size=4)
+        self.image = POD_SURFACE
         self.rect = self.image.get_rect()
-        self.world_pos.update(x, random.uniform(PLAYFIELD_TOP + 100, PLAYFIELD_TOP + 220))
-        self.velocity.update(random.choice([-1, 1]) * POD_SPEED, 0)
+        self.pos_x, self.pos_y = x, random.uniform(PLAYFIELD_TOP + 100, PLAYFIELD_TOP + 220)
+        self.vel_x, self.vel_y = random.choice([-1, 1]) * POD_SPEED, 0.0
         self.points = 500
 
     def update(self, dt: float):
         super().update(dt)
-        self.world_pos.x = wrap_position(self.world_pos.x + self.velocity.x * dt)
+        self.pos_x = (self.pos_x + self.vel_x * dt) % WORLD_WIDTH
         if random.random() < 0.01:
-            self.velocity.x *= -1
-        vertical_offset = math.sin(pygame.time.get_ticks() * 0.002 + self.world_pos.x * 0.01) * POD_VERTICAL_RANGE * dt
-        self.world_pos.y = clamp(self.world_pos.y + vertical_offset, PLAYFIELD_TOP + 80, PLAYFIELD_TOP + 240)
+            self.vel_x *= -1
+        y = self.pos_y + math.sin(self.game.tick_phase + self.pos_x * 0.01) * POD_VERTICAL_RANGE * dt
+        if y < POD_MIN_Y:
+            y = POD_MIN_Y
+        elif y > POD_MAX_Y:
+            y = POD_MAX_Y
+        self.pos_y = y
 
     def destroy(self):
         swarm_count = random.randint(*POD_SWARMER_COUNT)
-        for _ in range(swarm_count):
-            offset_x = random.uniform(-80, 80)
-            offset_y = random.uniform(-60, 60)
-            spawn_x = wrap_position(self.world_pos.x + offset_x)
-            spawn_y = clamp(self.world_pos.y + offset_y, PLAYFIELD_TOP + 20, SCREEN_HEIGHT - 140)
-            self.game.spawn_swarmer(spawn_x, spawn_y)
+        coords = [
+            (
+                wrap_position(self.pos_x + random.uniform(-80, 80)),
+                clamp(self.pos_y + random.uniform(-60, 60), SWARMER_MIN_Y, SWARMER_MAX_Y),
+            )
+            for _ in range(swarm_count)
+        ]
+        self.game.spawn_swarmers_batch(coords)
         super().destroy()
 
 
 class Swarmer(Enemy):
     """Aggressive drone spawned from pods that homes in on the player."""
+    __slots__ = ()
     def __init__(self, game: "DefenderGame", x: float, y: float):
         super().__init__(game)
-        pixel_pattern = [
-            ".R.",
-            "RRR",
-            "RFR",
-            "R.R",
-        ]
-        palette = {
-            "R": (255, 0, 0),
-            "F": (255, 102, 0),
-        }
-        self.image = surface_from_pattern(pixel_pattern, palette, pixel_size=4)
+        self.image = SWARMER_SURFACE
         self.rect = self.image.get_rect()
-        self.world_pos.update(x, y)
+        self.pos_x, self.pos_y = x, y
         self.points = 150
         self.fire_timer = 9999
 
     def update(self, dt: float):
         super().update(dt)
-        if not self.game.player:
+        player = self.game.player
+        if not player:
             return
-        to_player = pygame.math.Vector2(
-            shortest_offset(self.game.player.world_pos.x, self.world_pos.x),
-            self.game.player.world_pos.y - self.world_pos.y,
-        )
-        if to_player.length_squared() > 0:
-            direction = to_player.normalize()
-            self.world_pos.x = wrap_position(self.world_pos.x + direction.x * SWARMER_SPEED * dt)
-            self.world_pos.y += direction.y * SWARMER_SPEED * dt
-        self.world_pos.y = clamp(self.world_pos.y, PLAYFIELD_TOP + 20, SCREEN_HEIGHT - 140)
-        self.world_pos.x = wrap_position(self.world_pos.x + random.uniform(-SWARMER_JITTER, SWARMER_JITTER) * dt)
+        # shortest_offset, inlined: homing runs for every swarmer and baiter each tick.
+        dx = (player.pos_x - self.pos_x) % WORLD_WIDTH
+        if dx > _HALF_WORLD:
+            dx -= WORLD_WIDTH
+        dy = player.pos_y - self.pos_y
+        distance = math.hypot(dx, dy)
+        if distance:
+            step = SWARMER_SPEED * dt / distance
+            self.pos_x = (self.pos_x + dx * step) % WORLD_WIDTH
+            self.pos_y += dy * step
+        y = self.pos_y
+        if y < SWARMER_MIN_Y:
+            y = SWARMER_MIN_Y
+        elif y > SWARMER_MAX_Y:
+            y = SWARMER_MAX_Y
+        self.pos_y = y
+        self.pos_x = (self.pos_x + SWARMER_JITTER * next(_JITTER) * dt) % WORLD_WIDTH
 
 
 class Baiter(Enemy):
     """Fast hunter that spawns when the player stalls, keeping pressure high."""
+    __slots__ = ()
     def __init__(self, game: "DefenderGame", x: float):
         super().__init__(game)
-        pixel_pattern = [
-            ".DGGGD.",
-            "DGGGGGD",
-            "GGYYYYG",
-            ".DGGGD.",
-        ]
-        body_color = (0, 255, 0)
-        outline_color = (0, 120, 0)
-        palette = {
-            "D": outline_color,
-            "G": body_color,
-            "Y": (255, 255, 51),
-        }
-        self.image = surface_from_pattern(pixel_pattern, palette, pixel_size=4)
+        self.image = BAITER_SURFACE
         self.rect = self.image.get_rect()
-        self.world_pos.update(x, random.uniform(PLAYFIELD_TOP + 120, PLAYFIELD_TOP + 200))
+        self.pos_x, self.pos_y = x, random.uniform(PLAYFIELD_TOP + 120, PLAYFIELD_TOP + 200)
         self.fire_timer = random.uniform(*BAITER_FIRE_INTERVAL)
         self.points = 750
 
     def update(self, dt: float):
         super().update(dt)
-        if not self.game.player:
+        player = self.game.player
+        if not player:
             return
-        to_player = pygame.math.Vector2(
-            shortest_offset(self.game.player.world_pos.x, self.world_pos.x),
-            self.game.player.world_pos.y - self.world_pos.y,
-        )
-        if to_player.length_squared() > 0:
-            direction = to_player.normalize()
-            self.world_pos.x = wrap_position(self.world_pos.x + direction.x * BAITER_SPEED * dt)
-            self.world_pos.y += direction.y * BAITER_SPEED * dt
-        self.world_pos.y = clamp(self.world_pos.y, PLAYFIELD_TOP + 40, SCREEN_HEIGHT - 140)
+        # shortest_offset, inlined: homing runs for every swarmer and baiter each tick.
+        dx = (player.pos_x - self.pos_x) % WORLD_WIDTH
+        if dx > _HALF_WORLD:
+            dx -= WORLD_WIDTH
+        dy = player.pos_y - self.pos_y
+        distance = math.hypot(dx, dy)
+        if distance:
+            step = BAITER_SPEED * dt / distance
+            self.pos_x = (self.pos_x + dx * step) % WORLD_WIDTH
+            self.pos_y += dy * step
+        y = self.pos_y
+        if y < BAITER_MIN_Y:
+            y = BAITER_MIN_Y
+        elif y > BAITER_MAX_Y:
+            y = BAITER_MAX_Y
+        self.pos_y = y
 
         self.fire_timer -= dt
         if self.fire_timer <= 0:
             self.fire_timer = random.uniform(*BAITER_FIRE_INTERVAL)
-            self.fire()
+            if self.active:
+                self.fire()
 
     def fire(self):
         if not self.game.player:
             return
-        direction = pygame.math.Vector2(
-            shortest_offset(self.game.player.world_pos.x, self.world_pos.x),
-            self.game.player.world_pos.y - self.world_pos.y,
-        )
-        if direction.length_squared() == 0:
+        player = self.game.player
+        dx = shortest_offset(player.pos_x, self.pos_x)
+        dy = player.pos_y - self.pos_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
             return
-        bullet = EnemyShot(
-            self.world_pos.x,
-            self.world_pos.y,
-            direction.normalize() * MUTANT_SHOT_SPEED,
-        )
-        self.game.enemy_shots.add(bullet)
-        self.game.all_sprites.add(bullet)
+        scale = MUTANT_SHOT_SPEED / distance
+        self.game.spawn_enemy_shot(self.pos_x, self.pos_y, dx * scale, dy * scale)
         self.game.sfx.play("enemy_fire")
 
 
+# Particle effects ----------------------------------------------------------------
+def _tick_particles_loop(pos_x, pos_y, vel_x, vel_y, ttl, dt, gravity, damping, world_width):
+    """Fused per-particle integration step, compiled with Numba when available."""
+    for i in range(ttl.shape[0]):
+        x = pos_x[i] + vel_x[i] * dt
+        pos_x[i] = x % world_width
+        pos_y[i] += vel_y[i] * dt
+        ttl[i] -= dt
+        vel_x[i] *= damping
+        vel_y[i] = (vel_y[i] + gravity * dt) * damping
+
+
+def _tick_particles_numpy(pos_x, pos_y, vel_x, vel_y, ttl, dt, gravity, damping, world_width):
+    pos_x += vel_x * dt
+    pos_y += vel_y * dt
+    np.mod(pos_x, world_width, out=pos_x)
+    ttl -= dt
+    if gravity:
+        vel_y += gravity * dt
+    if damping != 1.0:
+        vel_x *= damping
+        vel_y *= damping
+
+
+_tick_particles = (
+    njit(cache=True, fastmath=True)(_tick_particles_loop) if njit is not None else _tick_particles_numpy
+)
+
+
+class ParticleSystem:
+    """Structure-of-arrays pool for short-lived debris that never collides.
+
+    Positions, velocities and lifetimes live in flat NumPy arrays so a whole
+    burst advances with a handful of vectorised operations per frame.
+    """
+
+    def __init__(self, *, gravity: float = 0.0, drag: float = 0.0):
+        self.gravity = gravity
+        self.drag = drag
+        self.clear()
+
+    def clear(self):
+        self.pos_x = np.empty(0, dtype=np.float32)
+        self.pos_y = np.empty(0, dtype=np.float32)
+        self.vel_x = np.empty(0, dtype=np.float32)
+        self.vel_y = np.empty(0, dtype=np.float32)
+        self.ttl = np.empty(0, dtype=np.float32)
+        self.size = np.empty(0, dtype=np.int32)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return self.ttl.size
+
+    def emit(
+        self,
+        x: Union[float, np.ndarray],
+        y: Union[float, np.ndarray],
+        vel_x: np.ndarray,
+        vel_y: np.ndarray,
+        ttl: np.ndarray,
+        size: np.ndarray,
+        color: np.ndarray,
+    ):
+        """Append a burst of particles; scalar positions are broadcast to every particle."""
+        count = len(ttl)
+        self.pos_x = np.concatenate((self.pos_x, np.broadcast_to(np.float32(x), count)))
+        self.pos_y = np.concatenate((self.pos_y, np.broadcast_to(np.float32(y), count)))
+        self.vel_x = np.concatenate((self.vel_x, np.asarray(vel_x, dtype=np.float32)))
+        self.vel_y = np.concatenate((self.vel_y, np.asarray(vel_y, dtype=np.float32)))
+        self.ttl = np.concatenate((self.ttl, np.asarray(ttl, dtype=np.float32)))
+        self.size = np.concatenate((self.size, np.asarray(size, dtype=np.int32)))
+        self.color = np.concatenate((self.color, np.asarray(color, dtype=np.uint8).reshape(-1, 3)))
+
+    def update(self, dt: float):
+        if not self.ttl.size:
+            return
+        damping = 1.0 - self.drag * dt if self.drag else 1.0
+        _tick_particles(
+            self.pos_x, self.pos_y, self.vel_x, self.vel_y, self.ttl,
+            np.float32(dt), np.float32(self.gravity), np.float32(damping), np.float32(WORLD_WIDTH),
+        )
+        # Compaction stays in NumPy so the kernel itself is a straight loop.
+        alive = self.ttl > 0
+        if not alive.all():
+            self.pos_x = self.pos_x[alive]
+            self.pos_y = self.pos_y[alive]
+            self.vel_x = self.vel_x[alive]
+            self.vel_y = self.vel_y[alive]
+            self.ttl = self.ttl[alive]
+            self.size = self.size[alive]
+            self.color = self.color[alive]
+
+    def draw(self, surface: pygame.Surface, camera_x: float):
+        if not self.ttl.size:
+            return
+        screen_x = world_to_screen_batch(self.pos_x, camera_x).astype(np.int32)
+        visible = np.nonzero((screen_x >= -8) & (screen_x <= SCREEN_WIDTH + 8))[0]
+        if not visible.size:
+            return
+        sizes = self.size[visible]
+        lefts = screen_x[visible] - sizes // 2
+        tops = self.pos_y[visible].astype(np.int32) - sizes // 2
+        colors = self.color[visible]
+        fill = surface.fill
+        for left, top, size, color in zip(lefts.tolist(), tops.tolist(), sizes.tolist(), colors.tolist()):
+            fill(color, (left, top, size, size))
+
+
+class BulletPool:
+    """Array-backed motion for enemy shots, stepped in one vectorised pass.
+
+    Shots are purely ballistic, so positions, velocities and lifetimes live in
+    preallocated NumPy rows; the matching ``EnemyShot`` sprites are kept in
+    the same order and receive their new positions after each step.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.pos = np.empty((capacity, 2))
+        self.vel = np.empty((capacity, 2))
+        self.ttl = np.empty(capacity)
+        self.shots: list[EnemyShot] = []
+
+    def __len__(self) -> int:
+        return len(self.shots)
+
+    def clear(self):
+        self.shots.clear()
+
+    def spawn(self, shot: EnemyShot, ttl: float) -> int:
+        """Register a shot and return its row index."""
+        index = len(self.shots)
+        if index == len(self.ttl):
+            # Grow geometrically so a pod burst never reallocates every frame.
+            self.pos = np.concatenate((self.pos, np.empty_like(self.pos)))
+            self.vel = np.concatenate((self.vel, np.empty_like(self.vel)))
+            self.ttl = np.concatenate((self.ttl, np.empty_like(self.ttl)))
+        self.pos[index] = shot.pos_x, shot.pos_y
+        self.vel[index] = shot.vel_x, shot.vel_y
+        self.ttl[index] = ttl
+        self.shots.append(shot)
+        return index
+
+    def kill_outside(self, low: float, high: float):
+        """Kill shots whose Y has left [low, high]; the next step compacts their rows."""
+        shots = self.shots
+        if not shots:
+            return
+        ys = self.pos[:len(shots), 1]
+        for index in np.flatnonzero((ys < low) | (ys > high)).tolist():
+            shots[index].kill()
+
+    def step(self, dt: float, camera_x: float, count: int):
+        """Advance the first `count` shots, then project those rows to screen rects in one go.
+
+        Shots spawned after `count` was taken left their muzzle this tick, so they
+        keep their spawn position and full ttl until the next step.
+        """
+        shots = self.shots
+        if not count:
+            return
+        pos = self.pos[:count]
+        ttl = self.ttl[:count]
+        pos += self.vel[:count] * dt
+        np.mod(pos[:, 0], WORLD_WIDTH, out=pos[:, 0])
+        ttl -= dt
+        # Same arithmetic as WorldSprite.update_rect, so the rects match it exactly.
+        offsets = np.mod(pos[:, 0] - camera_x, WORLD_WIDTH)
+        offsets[offsets > _HALF_WORLD] -= WORLD_WIDTH
+        screen_xs = (offsets + _HALF_SCREEN).astype(np.intp).tolist()
+        screen_ys = pos[:, 1].astype(np.intp).tolist()
+
+        keep = []
+        rows = zip(shots, pos[:, 0].tolist(), pos[:, 1].tolist(), screen_xs, screen_ys, (ttl > 0).tolist())
+        for shot, x, y, screen_x, screen_y, live in rows:
+            # Collisions and wave resets kill sprites directly, so re-check membership.
+            if live and shot.alive():
+                shot.pos_x = x
+                shot.pos_y = y
+                rect = shot.rect
+                rect.centerx = screen_x
+                rect.centery = screen_y
+                keep.append(True)
+            else:
+                shot.kill()
+                keep.append(False)
+        if all(keep):
+            return
+        total = len(shots)
+        keep.extend([True] * (total - count))
+        mask = np.array(keep)
+        alive = int(mask.sum())
+        self.pos[:alive] = self.pos[:total][mask]
+        self.vel[:alive] = self.vel[:total][mask]
+        self.ttl[:alive] = self.ttl[:total][mask]
+        self.shots = [shot for shot, kept in zip(shots, keep) if kept]
+
+
 # Background starfield -----------------------------------------------------------
 class StarField:
+    """Parallax star layers written straight into the target surface's pixels.
+
+    Every star lives in flat NumPy arrays, so a frame is one vectorised
+    projection plus a single fancy-indexed store of 2x2 dots.
+    """
+
+    # Pixel offsets covering each star's 2x2 dot.
+    _DOT_X = np.array([0, 1, 0, 1], dtype=np.intp)
+    _DOT_Y = np.array([0, 0, 1, 1], dtype=np.intp)
+
     def __init__(self):
-        self.layers = []
+        xs, ys, parallax, layer_ids = [], [], [], []
         for layer in range(STAR_LAYERS):
             layer_speed = 20 + layer * 40
-            stars = [
-                (random.uniform(0, WORLD_WIDTH), random.uniform(0, SCREEN_HEIGHT), layer_speed)
-                for _ in range(STARS_PER_LAYER)
-            ]
-            self.layers.append(stars)
+            xs.append(np.random.uniform(0, WORLD_WIDTH, STARS_PER_LAYER))
+            ys.append(np.random.uniform(0, SCREEN_HEIGHT, STARS_PER_LAYER).astype(np.intp))
+            parallax.append(np.full(STARS_PER_LAYER, layer_speed / 80.0))
+            layer_ids.append(np.full(STARS_PER_LAYER, layer % len(STAR_COLORS), dtype=np.intp))
+        self.xs = np.concatenate(xs)
+        self.ys = np.concatenate(ys)
+        self.parallax = np.concatenate(parallax)
+        self.color_index = np.concatenate(layer_ids)
+        self._mapped_surface: Optional[pygame.Surface] = None
+        self._mapped_colors = np.empty(0, dtype=np.uint32)
+        self._pixels2d = True
 
     def draw(self, surface: pygame.Surface, camera_x: float):
-        for layer_index, stars in enumerate(self.layers):
-            color = STAR_COLORS[layer_index % len(STAR_COLORS)]
-            for sx, sy, speed in stars:
-                screen_x = world_to_screen(sx, camera_x * (speed / 80.0))
-                if -4 <= screen_x <= SCREEN_WIDTH + 4:
-                    surface.fill(color, pygame.Rect(int(screen_x), int(sy), 2, 2))
+        if surface is not self._mapped_surface:
+            # Colours are stored in the surface's own pixel format.
+            palette = np.array([surface.map_rgb(color) for color in STAR_COLORS], dtype=np.uint32)
+            self._mapped_colors = palette[self.color_index]
+            self._mapped_surface = surface
+            # surfarray has no 2D view of 24-bit pixels.
+            self._pixels2d = surface.get_bytesize() != 3
+        # World X that lands four pixels left of the screen edge for each star's layer.
+        left = np.mod(camera_x * self.parallax - (SCREEN_WIDTH / 2 + 4), WORLD_WIDTH)
+        screen_x = (np.mod(self.xs - left, WORLD_WIDTH) - 4).astype(np.intp)
+        visible = screen_x < SCREEN_WIDTH
+        if not self._pixels2d:
+            # Clip explicitly: fill() shifts a rect hanging off the left edge instead.
+            fill, clip = surface.fill, surface.get_rect().clip
+            rows = zip(screen_x[visible].tolist(), self.ys[visible].tolist(), self._mapped_colors[visible].tolist())
+            for x, y, color in rows:
+                fill(color, clip((x, y, 2, 2)))
+            return
+        px = (screen_x[visible][:, None] + self._DOT_X).ravel()
+        py = (self.ys[visible][:, None] + self._DOT_Y).ravel()
+        colors = np.repeat(self._mapped_colors[visible], 4)
+        inside = (px >= 0) & (px < SCREEN_WIDTH) & (py < SCREEN_HEIGHT)
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[px[inside], py[inside]] = colors[inside]
+        # Drop the array view promptly so the surface is unlocked for blitting.
+        del pixels
+
+
+def _seek(
+    player: "Player",
+    move_vector: pygame.math.Vector2,
+    target_x: float,
+    target_y: float,
+    weight: float = 1.0,
+    max_dx: float = 180.0,
+    max_dy: float = 120.0,
+) -> tuple[float, float]:
+    """Steer the demo pilot toward a point; returns the wrapped offset to it."""
+    dx = shortest_offset(target_x, player.pos_x)
+    dy = target_y - player.pos_y
+    if max_dx > 0:
+        move_vector.x += weight * clamp(dx / max_dx, -1.0, 1.0)
+    if max_dy > 0:
+        move_vector.y += weight * clamp(dy / max_dy, -1.0, 1.0)
+    return dx, dy
 
 
 # Main game controller -----------------------------------------------------------
@@ -1698,12 +2358,42 @@ class DefenderGame:
         self.enemies = pygame.sprite.Group()
         self.lasers = pygame.sprite.Group()
         self.enemy_shots = pygame.sprite.Group()
+        # Mines also live in enemy_shots for drawing and collisions; this typed
+        # group lets mine-only passes skip per-sprite type checks.
+        self.mines = pygame.sprite.Group()
+        # Likewise landers, which the demo pilot and the mutant swarm look up by type.
+        self.landers = pygame.sprite.Group()
         self.humans = pygame.sprite.Group()
+        self.laser_hash = SpatialHash()
+        self.shot_hash = SpatialHash()
+        # Last text and surface per HUD slot; see render_text().
+        self.text_cache: dict[str, tuple[str, pygame.Surface]] = {}
+        # Reused (x, y) buffers for the ground and scanner terrain polylines.
+        self.ground_points = np.column_stack((_GROUND_SCREEN_XS, np.zeros_like(_GROUND_SCREEN_XS)))
+        self.scanner_span: Optional[tuple[int, int]] = None
+        self.scanner_points = np.empty((0, 2), dtype=np.intp)
+        self.scanner_offsets = np.empty(0)
+        self.player_pulse_frames: dict[pygame.Surface, pygame.Surface] = {}
+        self.shard_templates: dict[int, list[tuple[list[pygame.Surface], pygame.math.Vector2, pygame.math.Vector2]]] = {}
+        self.ground_particles = ParticleSystem(gravity=220.0)
+        self.hyperspace_debris = ParticleSystem(drag=6.0)
+        self.bullet_pool = BulletPool()
+        # Structure-of-arrays snapshot of enemy positions, see refresh_enemy_arrays().
+        self.enemy_list: list[Enemy] = []
+        self.enemy_pos = np.empty((0, 2))
+        self.mine_list: list[Mine] = []
+        self.mine_pos = np.empty((0, 2))
+        # Grounded humans sorted by X, see refresh_human_index().
+        self.ground_humans: list[Human] = []
+        self.ground_human_xs: list[float] = []
         self.player: Optional[Player] = None
         self.spawn_timer = LANDER_SPAWN_INTERVAL
-        self.state = "playing"
+        self.state = GAME_PLAYING
         self.message_timer: Optional[Timer] = None
         self.camera_x = 0.0
+        # Shared oscillator for bobbing enemies, refreshed once per update.
+        self.tick_phase = 0.0
+        self.tick_sin = 0.0
         self.font = pygame.font.SysFont("Consolas", 20)
         self.big_font = pygame.font.SysFont("Consolas", 42, bold=True)
         self.popup_font = pygame.font.SysFont("Consolas", 18, bold=True)
@@ -1717,22 +2407,24 @@ class DefenderGame:
         self.wave_timer = 0.0
         self.baiter_spawned = False
         self.sfx = SoundManager()
-        self.pending_spawns: list[tuple[float, int, Callable, tuple]] = []
+        # Sorted latest-first so the next due spawn is always popped from the end.
+        self.pending_spawns: list[tuple[float, Callable, tuple]] = []
         self.smart_bombs = 0
         self.hyperspace_cooldown = 0.0
         self.radar_blink_timer = 0.0
         self.radar_warning = False
         self.radar_ground_destroyed = False
-        self.spawn_sequence = 0
         self.demo_active = False
         self.demo_stage: Optional[str] = None
         self.demo_stage_timer = 0.0
+        # Position in the demo pilot's fire heartbeat, wrapped to one cycle.
+        self.demo_fire_clock = 0.0
         self.demo_target_lander: Optional["Lander"] = None
         self.demo_target_human: Optional[Human] = None
         self.demo_mutant_observed = False
         self.demo_prev_no_death = False
         self.demo_sound_enabled = self.sfx.enabled
-        self.state = "title"
+        self.state = GAME_TITLE
         self.title_timer = 0.0
         self.demo_duration = 15.0
         self.setup_world()
@@ -1743,20 +2435,35 @@ class DefenderGame:
         self.enemies.empty()
         self.lasers.empty()
         self.enemy_shots.empty()
+        self.mines.empty()
+        self.landers.empty()
         self.humans.empty()
+        self.ground_particles.clear()
+        self.hyperspace_debris.clear()
+        self.bullet_pool.clear()
         self.repopulate_humans()
         self.player = Player(self)
         self.all_sprites.add(self.player)
         self.wave = 1
         self.total_wave_aliens = 0
         self.remaining_aliens = 0
-        if self.state == "playing":
+        if self.state == GAME_PLAYING:
+            # start_wave brings the ground back itself.
             self.start_wave(initial=True)
+        else:
+            self.restore_ground()
+
+    def restore_ground(self):
+        """Bring the planet back after a mutant swarm destroyed it.
+
+        draw_ground and draw_scanner skip all terrain sampling while these flags
+        are set, so they are only ever flipped together.
+        """
         self.ground_destroyed = False
+        self.radar_ground_destroyed = False
 
     def repopulate_humans(self):
-        for human in list(self.humans):
-            self.all_sprites.remove(human)
+        self.all_sprites.remove(*self.humans.sprites())
         self.humans.empty()
         for x in HUMAN_POSITIONS:
             human = Human(self, x)
@@ -1802,8 +2509,9 @@ class DefenderGame:
         def random_positions(count: int) -> list[float]:
             if count <= 0:
                 return []
+            # One jittered slot per spawn; tolist() hands sprites plain floats.
             spacing = WORLD_WIDTH / count
-            return [(i + random.random()) * spacing % WORLD_WIDTH for i in range(count)]
+            return ((np.arange(count) + np.random.random(count)) * spacing % WORLD_WIDTH).tolist()
 
         spawn_plan = (
             ("landers", self.spawn_lander, 0.5, 1.0),
@@ -1836,7 +2544,7 @@ class DefenderGame:
             self.player.velocity_x = PLAYER_CRUISE_SPEED * self.player.direction
             self.player.pending_speed = abs(self.player.velocity_x)
             self.player.throttle_active = False
-            self.player.hyperspace_state = "idle"
+            self.player.hyperspace_state = HYPERSPACE_IDLE
             self.player.hyperspace_timer = 0.0
             self.player.controls_lock = 0.0
             self.player.render_visible = True
@@ -1845,8 +2553,7 @@ class DefenderGame:
         self.wave_timer = 0.0
         self.baiter_spawned = False
         self.spawn_wave_enemies()
-        self.ground_destroyed = False
-        self.radar_ground_destroyed = False
+        self.restore_ground()
         if initial:
             self.set_message(DEFAULT_HINT, 4.0)
         else:
@@ -1855,9 +2562,9 @@ class DefenderGame:
         self.hyperspace_cooldown = 0.0
 
     def clear_wave_state(self):
-        for projectile in list(self.lasers):
+        for projectile in self.lasers.sprites():
             projectile.kill()
-        for projectile in list(self.enemy_shots):
+        for projectile in self.enemy_shots.sprites():
             projectile.kill()
         if self.player:
             if self.player.held_human:
@@ -1866,7 +2573,6 @@ class DefenderGame:
         self.remaining_aliens = 0
         self.baiter_spawned = False
         self.pending_spawns.clear()
-        self.spawn_sequence = 0
 
     def begin_next_wave(self):
         self.wave += 1
@@ -1877,18 +2583,24 @@ class DefenderGame:
     def enemy_destroyed(self, enemy: Enemy):
         self.remaining_aliens = max(0, self.remaining_aliens - 1)
 
-    def register_enemy_spawn(self):
-        self.remaining_aliens += 1
-        self.total_wave_aliens += 1
+    def register_enemy_spawn(self, count: int = 1):
+        self.remaining_aliens += count
+        self.total_wave_aliens += count
 
     def queue_spawn(self, delay: float, func: Callable, *args):
-        self.spawn_sequence += 1
         spawn_time = self.wave_timer + delay
-        heapq.heappush(self.pending_spawns, (spawn_time, self.spawn_sequence, func, args))
+        pending = self.pending_spawns
+        # Waves queue in rising delay order, so the slot is almost always found at the front.
+        # Ties land ahead of existing entries, which keeps equal times first-in first-out.
+        index = 0
+        while index < len(pending) and pending[index][0] > spawn_time:
+            index += 1
+        pending.insert(index, (spawn_time, func, args))
 
     def spawn_lander(self, x: float):
         lander = Lander(self, x)
         self.enemies.add(lander)
+        self.landers.add(lander)
         self.all_sprites.add(lander)
         self.register_enemy_spawn()
 
@@ -1910,18 +2622,34 @@ class DefenderGame:
         self.all_sprites.add(swarmer)
         self.register_enemy_spawn()
 
+    def spawn_swarmers_batch(self, coords: Sequence[tuple[float, float]]):
+        """Spawn a pod's whole swarm with one add per group."""
+        if not coords:
+            return
+        swarmers = [Swarmer(self, x, y) for x, y in coords]
+        self.enemies.add(*swarmers)
+        self.all_sprites.add(*swarmers)
+        self.register_enemy_spawn(len(swarmers))
+
     def spawn_baiter(self):
-        baiter_x = self.player.world_pos.x if self.player else WORLD_WIDTH / 2
-        baiter = Baiter(self, wrap_position(baiter_x + WORLD_WIDTH / 2 * random.choice([-1, 1])))
+        baiter_x = self.player.pos_x if self.player else WORLD_WIDTH / 2
+        baiter = Baiter(self, (baiter_x + WORLD_WIDTH / 2 * random.choice([-1, 1])) % WORLD_WIDTH)
         self.enemies.add(baiter)
         self.all_sprites.add(baiter)
         self.register_enemy_spawn()
         self.baiter_spawned = True
         self.sfx.play("baiter")
 
+    def spawn_enemy_shot(self, x: float, y: float, vel_x: float, vel_y: float, ttl: float = 2.0):
+        shot = EnemyShot(x, y, (vel_x, vel_y))
+        self.enemy_shots.add(shot)
+        self.all_sprites.add(shot)
+        self.bullet_pool.spawn(shot, ttl)
+
     def spawn_mine(self, x: float, y: float):
         mine = Mine(self, x, y)
         self.enemy_shots.add(mine)
+        self.mines.add(mine)
         self.all_sprites.add(mine)
         self.sfx.play("mine")
     def spawn_hyperspace_flash(self, x: float, y: float, invert: bool = False):
@@ -1931,27 +2659,48 @@ class DefenderGame:
     def spawn_hyperspace_shatter(self, player: Player):
         base = player.base_images[player.hyperspace_entry_direction]
         width, height = base.get_size()
-        colors = []
-        for _ in range(120):
-            px, py = random.randint(0, width - 1), random.randint(0, height - 1)
-            color = base.get_at((px, py))
-            if color.a > 0:
-                colors.append(color)
-        for color in colors:
-            fragment = HyperspaceFragment(player.world_pos.x, player.world_pos.y, color)
-            self.all_sprites.add(fragment)
+        px = np.random.randint(0, width, 120)
+        py = np.random.randint(0, height, 120)
+        # Gather every sample in one indexed read, then drop the views to unlock the shared frame.
+        alpha = pygame.surfarray.pixels_alpha(base)
+        opaque = alpha[px, py] > 0
+        del alpha
+        rgb = pygame.surfarray.pixels3d(base)
+        colors = rgb[px[opaque], py[opaque]]
+        del rgb
+        count = len(colors)
+        if not count:
+            return
+        angle = np.random.uniform(0, math.tau, count)
+        speed = np.random.uniform(300, 600, count)
+        self.hyperspace_debris.emit(
+            player.pos_x,
+            player.pos_y,
+            speed * np.cos(angle),
+            speed * np.sin(angle),
+            np.random.uniform(0.12, 0.18, count),
+            np.random.randint(2, 5, count),
+            colors,
+        )
 
     def spawn_hyperspace_afterimages(self, player: Player):
         for i in range(1, 4):
             offset = pygame.math.Vector2(-player.direction * i * 12, -i * 4)
-            image = player.base_images[player.direction]
-            ghost = HyperspaceAfterImage(player.world_pos.x + offset.x, player.world_pos.y + offset.y, image)
+            image = HYPERSPACE_AFTERIMAGE_SHIP if player.direction == 1 else HYPERSPACE_AFTERIMAGE_SHIP_FLIPPED
+            ghost = HyperspaceAfterImage(player.pos_x + offset.x, player.pos_y + offset.y, image)
             self.all_sprites.add(ghost)
 
-    # Slice the ship into an 8-piece grid (corners + edge centers) and animate the shards.
-    # When outward=True the pieces blow apart; when False they converge and notify the player.
-    def spawn_hyperspace_shards(self, player: Player, outward: bool):
-        base = player.base_images[player.hyperspace_entry_direction]
+    def shard_template(self, player: Player, direction: int) -> list[tuple[list[pygame.Surface], pygame.math.Vector2, pygame.math.Vector2]]:
+        """Slice the ship facing `direction` into an 8-piece grid (corners + edge centers).
+
+        Returns (alpha frames, offset from ship centre, unit flight direction) per
+        piece. The geometry never changes between jumps, so it is built once per
+        facing and shared by every later jump.
+        """
+        template = self.shard_templates.get(direction)
+        if template is not None:
+            return template
+        base = player.base_images[direction]
         base_width, base_height = base.get_size()
         third_w = [base_width // 3, base_width // 3, base_width - 2 * (base_width // 3)]
         third_h = [base_height // 3, base_height // 3, base_height - 2 * (base_height // 3)]
@@ -1959,15 +2708,7 @@ class DefenderGame:
         x_offsets = [0, third_w[0], third_w[0] + third_w[1]]
         y_offsets = [0, third_h[0], third_h[0] + third_h[1]]
 
-        entry_pos = pygame.math.Vector2(player.world_pos.x, player.world_pos.y)
-        center = entry_pos
-        extent = max(SCREEN_WIDTH, SCREEN_HEIGHT) * 0.9
-        duration = 1.35
-
-        if outward:
-            player.hyperspace_inbound_shards = 0
-
-        shards_created = 0
+        template = []
         for row in range(3):
             for col in range(3):
                 if row == 1 and col == 1:
@@ -1980,46 +2721,90 @@ class DefenderGame:
                 piece_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
                 piece_surface.blit(base, (0, 0), rect)
                 offset = pygame.math.Vector2(rect.centerx - base_width / 2, rect.centery - base_height / 2)
-                direction = pygame.math.Vector2(col - 1, row - 1)
-                if direction.length_squared() == 0:
-                    continue
-                direction = direction.normalize()
-                start = center + offset
-                target = start + direction * extent
-                if not outward:
-                    start, target = target, start
-                shard = HyperspaceShard(
-                    start,
-                    target,
-                    duration,
-                    piece_surface,
-                    fade_in=not outward,
-                    owner=player,
-                    inward=not outward,
-                )
-                self.all_sprites.add(shard)
-                shards_created += 1
+                heading = pygame.math.Vector2(col - 1, row - 1).normalize()
+                template.append((build_alpha_levels(piece_surface), offset, heading))
+        self.shard_templates[direction] = template
+        return template
+
+    # Animate the shard template: when outward=True the pieces blow apart; when
+    # False they converge and notify the player.
+    def spawn_hyperspace_shards(self, player: Player, outward: bool):
+        template = self.shard_template(player, player.hyperspace_entry_direction)
+        center = pygame.math.Vector2(player.pos_x, player.pos_y)
+        extent = max(SCREEN_WIDTH, SCREEN_HEIGHT) * 0.9
+        duration = 1.35
+
+        if outward:
+            player.hyperspace_inbound_shards = 0
+
+        shards = []
+        for frames, offset, heading in template:
+            start = center + offset
+            target = start + heading * extent
+            if not outward:
+                start, target = target, start
+            shards.append(HyperspaceShard(
+                start,
+                target,
+                duration,
+                frames,
+                fade_in=not outward,
+                owner=player,
+                inward=not outward,
+            ))
+        self.all_sprites.add(*shards)
 
         if not outward:
-            player.hyperspace_inbound_shards = shards_created
+            player.hyperspace_inbound_shards = len(shards)
+
+    def refresh_human_index(self):
+        """Sort grounded humans by X so landers can bisect for the nearest target."""
+        grounded = sorted(
+            (human for human in self.humans if human.state == HUMAN_GROUND and human.carrier is None),
+            key=lambda human: human.pos_x,
+        )
+        self.ground_humans = grounded
+        self.ground_human_xs = [human.pos_x for human in grounded]
+
+    def refresh_enemy_arrays(self):
+        """Snapshot live enemy positions into an (N, 2) array for batch queries.
+
+        Enemies keep their own scalar coordinates for per-sprite behaviour; the
+        snapshot lets proximity tests run as one vectorised pass instead. Rows
+        are ordered by X so hyperspace checks can binary-search a window.
+        """
+        enemies = self.enemies.sprites()
+        enemies.sort(key=_BY_POS_X)
+        self.enemy_list = enemies
+        self.enemy_pos = np.array([(enemy.pos_x, enemy.pos_y) for enemy in enemies], dtype=np.float64).reshape(-1, 2)
+        mines = self.mines.sprites()
+        mines.sort(key=_BY_POS_X)
+        self.mine_list = mines
+        self.mine_pos = np.array([(mine.pos_x, mine.pos_y) for mine in mines], dtype=np.float64).reshape(-1, 2)
+
+    def refresh_enemy_activity(self):
+        """Flag enemies near the camera; distant ones skip firing and cosmetic work."""
+        self.refresh_enemy_arrays()
+        if not self.enemy_list:
+            return
+        near = np.abs(shortest_offset_batch(self.enemy_pos[:, 0], self.camera_x)) < ENEMY_ACTIVE_RADIUS
+        for enemy, active in zip(self.enemy_list, near.tolist()):
+            enemy.active = active
 
     def is_hyperspace_safe(self, x: float, y: float) -> bool:
+        """Check a jump destination against terrain and the latest enemy and mine snapshot."""
         terrain = terrain_height(x)
         if y < terrain + 60 or y > SCREEN_HEIGHT - 80:
             return False
-        for enemy in self.enemies:
-            if abs(shortest_offset(enemy.world_pos.x, x)) < 80 and abs(enemy.world_pos.y - y) < 80:
-                return False
-        for mine in self.enemy_shots:
-            if isinstance(mine, Mine):
-                if abs(shortest_offset(mine.world_pos.x, x)) < 70 and abs(mine.world_pos.y - y) < 70:
-                    return False
-        return True
+        if any_within_sorted(self.enemy_pos, x, y, 80.0):
+            return False
+        return not any_within_sorted(self.mine_pos, x, y, 70.0)
 
     def perform_hyperspace_jump(self, player: Player):
         attempts = 0
-        destination = (player.world_pos.x, player.world_pos.y)
+        destination = (player.pos_x, player.pos_y)
         safe = False
+        self.refresh_enemy_arrays()
         while attempts < 3:
             attempts += 1
             candidate = (
@@ -2035,7 +2820,7 @@ class DefenderGame:
                 random.uniform(0, WORLD_WIDTH),
                 random.uniform(PLAYFIELD_TOP + 80, SCREEN_HEIGHT - 160),
             )
-        player.world_pos.update(*destination)
+        player.pos_x, player.pos_y = destination
         player.direction = player.hyperspace_entry_direction
         player.velocity_x = PLAYER_CRUISE_SPEED * player.direction
         player.pending_speed = abs(player.velocity_x)
@@ -2056,16 +2841,20 @@ class DefenderGame:
         self.smart_bombs -= 1
         self.sfx.play("smart_bomb")
         camera = self.camera_x
-        for enemy in list(self.enemies):
-            screen_x = world_to_screen(enemy.world_pos.x, camera)
-            if -enemy.rect.width <= screen_x <= SCREEN_WIDTH + enemy.rect.width:
-                self.explosion(enemy.world_pos.x, enemy.world_pos.y)
+        # Project the whole snapshot at once; only enemies inside the blast are visited.
+        self.refresh_enemy_arrays()
+        enemies = self.enemy_list
+        if enemies:
+            screen_x = world_to_screen_batch(self.enemy_pos[:, 0], camera)
+            widths = np.fromiter((enemy.rect.width for enemy in enemies), dtype=np.float64, count=len(enemies))
+            for index in np.nonzero((screen_x >= -widths) & (screen_x <= SCREEN_WIDTH + widths))[0].tolist():
+                enemy = enemies[index]
+                self.explosion(enemy.pos_x, enemy.pos_y)
                 enemy.take_damage(enemy.health)
-        for projectile in list(self.enemy_shots):
-            if isinstance(projectile, Mine):
-                screen_x = world_to_screen(projectile.world_pos.x, camera)
-                if -12 <= screen_x <= SCREEN_WIDTH + 12:
-                    projectile.kill()
+        if self.mine_list:
+            screen_x = world_to_screen_batch(self.mine_pos[:, 0], camera)
+            for index in np.nonzero((screen_x >= -12) & (screen_x <= SCREEN_WIDTH + 12))[0].tolist():
+                self.mine_list[index].kill()
 
     def activate_hyperspace(self):
         if self.player:
@@ -2083,7 +2872,7 @@ class DefenderGame:
             return
         if self.player.held_human:
             self.player.drop_carried_human(force_fall=True)
-        self.player.world_pos.update(WORLD_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.player.pos_x, self.player.pos_y = WORLD_WIDTH / 2, SCREEN_HEIGHT / 2
         self.player.invulnerable = PLAYER_RESPAWN_INVULN
         self.player.direction = 1
         self.player.thruster_color_index = 0
@@ -2102,28 +2891,28 @@ class DefenderGame:
         self.player.update_image()
 
     def game_over(self):
-        self.state = "game_over"
+        self.state = GAME_OVER
         self.message_timer = None
         self.sfx.stop("engine")
 
     def update(self, dt: float):
         pressed = pygame.key.get_pressed()
 
-        if self.state == "title":
+        if self.state == GAME_TITLE:
             self.title_timer += dt
             if not self.demo_active and self.title_timer >= self.demo_duration:
                 self.start_demo()
-            if self.state == "title":
+            if self.state == GAME_TITLE:
                 return
 
         if self.respawn_timer and self.respawn_timer.update(dt):
             self.respawn_timer = None
             self.finish_player_respawn()
 
-        if self.state == "demo":
+        if self.state == GAME_DEMO:
             self.update_demo(dt)
             input_source = self.player.demo_input if self.player and self.player.demo_input else self.demo_blank_input()
-        elif self.state != "playing":
+        elif self.state != GAME_PLAYING:
             return
         else:
             input_source = pressed
@@ -2131,25 +2920,39 @@ class DefenderGame:
         if self.player:
             self.player.update(dt, input_source)
             lead = self.player.get_camera_lead()
-            self.camera_x = wrap_position(self.player.world_pos.x + lead)
+            self.camera_x = (self.player.pos_x + lead) % WORLD_WIDTH
             self.player.check_extra_life()
 
         if self.hyperspace_cooldown > 0:
             self.hyperspace_cooldown = max(0.0, self.hyperspace_cooldown - dt)
 
         # Update sprites.
-        for sprite in list(self.all_sprites):
-            if isinstance(sprite, Player):
-                continue
-            sprite.update(dt)
-
-        # Refresh draw rectangles ahead of collision tests.
-        for sprite in self.all_sprites:
-            sprite.update_rect(self.camera_x)
+        self.tick_phase = pygame.time.get_ticks() * 0.002
+        self.tick_sin = math.sin(self.tick_phase)
+        self.refresh_human_index()
+        self.refresh_enemy_activity()
+        # One pass advances each sprite and refreshes its rect for the collision
+        # tests. The player was updated above with its input, so skip it by identity.
+        player = self.player
+        camera_x = self.camera_x
+        sprites = self.all_sprites.sprites()
+        pooled = len(self.bullet_pool)
+        for sprite in sprites:
+            if sprite is not player:
+                sprite.update(dt)
+            sprite.update_rect(camera_x)
+
+        # The pool projects the shots it moves; sprites spawned during the pass have no rect yet.
+        # Shots fired during the pass sit past `pooled` and start moving next tick.
+        self.bullet_pool.step(dt, camera_x, pooled)
+        self.ground_particles.update(dt)
+        self.hyperspace_debris.update(dt)
+        self.refresh_spawned_rects(sprites)
 
         self.wave_timer += dt
-        while self.pending_spawns and self.pending_spawns[0][0] <= self.wave_timer:
-            _, _, func, args = heapq.heappop(self.pending_spawns)
+        pending = self.pending_spawns
+        while pending and pending[-1][0] <= self.wave_timer:
+            _, func, args = pending.pop()
             func(*args)
 
         if self.radar_blink_timer > 0:
@@ -2165,18 +2968,17 @@ class DefenderGame:
         self.handle_human_interactions()
 
         # Check humans still alive.
-        alive_humans = [h for h in self.humans if h.state != "dead"]
+        alive_humans = [h for h in self.humans if h.state != HUMAN_DEAD]
         if not alive_humans:
             # Mutant party if everyone is gone.
             self.transform_landers()
 
-        # Clean up projectiles outside vertical bounds.
-        for laser in list(self.lasers):
-            if laser.world_pos.y < 0 or laser.world_pos.y > SCREEN_HEIGHT:
+        # Clean up projectiles outside vertical bounds; sprites() is already a private copy.
+        for laser in self.lasers.sprites():
+            if laser.pos_y < 0 or laser.pos_y > SCREEN_HEIGHT:
                 laser.kill()
-        for shot in list(self.enemy_shots):
-            if shot.world_pos.y < 0 or shot.world_pos.y > SCREEN_HEIGHT:
-                shot.kill()
+        # Mines never move, so only pooled shots can drift off the playfield.
+        self.bullet_pool.kill_outside(0, SCREEN_HEIGHT)
 
         if not self.enemies and not self.pending_spawns:
             self.begin_next_wave()
@@ -2186,53 +2988,91 @@ class DefenderGame:
             self.message_timer = None
             self.wave_message = None
 
+    def refresh_spawned_rects(self, snapshot: list[WorldSprite]):
+        """Refresh rects of sprites added to all_sprites since `snapshot` was taken.
+
+        Groups keep insertion order, so new members sit after every surviving
+        snapshot member; walk back from the end until one is reached.
+        """
+        members = self.all_sprites.spritedict
+        if not members or (snapshot and next(reversed(members)) is snapshot[-1]):
+            return
+        known = set(snapshot)
+        camera_x = self.camera_x
+        for sprite in reversed(members):
+            if sprite in known:
+                break
+            sprite.update_rect(camera_x)
+
+    # Screen-space area in which enemies can be shot: the playfield plus an 8px
+    # margin, widened by one pixel because colliderect tests edges strictly.
+    _LASER_VIEW = pygame.Rect(-9, HUD_HEIGHT - 9, SCREEN_WIDTH + 18, SCREEN_HEIGHT - HUD_HEIGHT + 18)
+
     def handle_collisions(self):
-        def sprite_visible(sprite: WorldSprite, *, margin: int = 0) -> bool:
-            rect = sprite.rect
-            return (
-                rect.right >= -margin
-                and rect.left <= SCREEN_WIDTH + margin
-                and rect.bottom >= HUD_HEIGHT - margin
-                and rect.top <= SCREEN_HEIGHT + margin
-            )
+        laser_hash = self.laser_hash
+        laser_hash.clear()
+        for laser in self.lasers:
+            laser_hash.insert(laser)
 
-        # Player lasers vs enemies.
-        for enemy in list(self.enemies):
-            if not sprite_visible(enemy, margin=8):
-                continue
-            hits = pygame.sprite.spritecollide(enemy, self.lasers, False, collided=pygame.sprite.collide_rect)
+        shot_hash = self.shot_hash
+        shot_hash.clear()
+        for shot in self.enemy_shots:
+            shot_hash.insert(shot)
+
+        def hits_in(spatial_hash: SpatialHash, target: WorldSprite) -> list[WorldSprite]:
+            rect = target.rect
+            return [
+                sprite
+                for sprite in spatial_hash.query(rect)
+                if sprite.alive() and rect.colliderect(sprite.rect)
+            ]
+
+        def laser_hits(target: WorldSprite) -> list[Laser]:
+            return hits_in(laser_hash, target)
+
+        # Player lasers vs enemies and colonists; nothing to test without lasers.
+        # Visibility is one C-level pass over the enemy rects, already fresh this tick.
+        enemies = self.enemies.sprites() if self.lasers else []
+        for index in self._LASER_VIEW.collidelistall([enemy.rect for enemy in enemies]):
+            enemy = enemies[index]
+            hits = laser_hits(enemy)
             if hits:
                 destroyed = enemy.take_damage(1)
                 if destroyed:
-                    self.explosion(enemy.world_pos.x, enemy.world_pos.y)
+                    self.explosion(enemy.pos_x, enemy.pos_y)
                 for laser in hits:
                     laser.kill()
 
-        for human in list(self.humans):
-            if human.state == "dead":
+        for human in self.humans.sprites() if self.lasers else ():
+            if human.state == HUMAN_DEAD:
                 continue
-            hits = pygame.sprite.spritecollide(human, self.lasers, False, collided=pygame.sprite.collide_rect)
+            hits = laser_hits(human)
             if hits:
                 human.die()
-                self.explosion(human.world_pos.x, human.world_pos.y)
+                self.explosion(human.pos_x, human.pos_y)
                 for laser in hits:
                     laser.kill()
 
         if self.player and self.player.invulnerable <= 0:
-            if pygame.sprite.spritecollide(self.player, self.enemies, False, collided=pygame.sprite.collide_rect):
-                self.explosion(self.player.world_pos.x, self.player.world_pos.y)
+            # One C-level scan over the enemies' screen rects.
+            if self.player.rect.collidelist([enemy.rect for enemy in self.enemies]) != -1:
+                self.explosion(self.player.pos_x, self.player.pos_y)
                 self.player.hit()
 
         if self.player and self.player.invulnerable <= 0:
-            if pygame.sprite.spritecollide(self.player, self.enemy_shots, True, collided=pygame.sprite.collide_rect):
-                self.explosion(self.player.world_pos.x, self.player.world_pos.y)
+            hits = hits_in(shot_hash, self.player)
+            if hits:
+                for shot in hits:
+                    shot.kill()
+                self.explosion(self.player.pos_x, self.player.pos_y)
                 self.player.hit()
 
         for human in self.humans:
-            if human.state == "dead":
+            if human.state == HUMAN_DEAD:
                 continue
             # Enemy shots are ignored for colonists to match classic Defender rules.
-            pygame.sprite.spritecollide(human, self.enemy_shots, True, collided=pygame.sprite.collide_rect)
+            for shot in hits_in(shot_hash, human):
+                shot.kill()
 
     def handle_human_interactions(self):
         if not self.player:
@@ -2240,23 +3080,23 @@ class DefenderGame:
 
         if not self.player.held_human:
             for human in self.humans:
-                if human.state != "falling":
+                if human.state != HUMAN_FALLING:
                     continue
                 if pygame.sprite.collide_rect(self.player, human):
                     self.player.pickup_human(human)
                     self.player.score += 250
-                    self.spawn_score_popup(human.world_pos.x, human.world_pos.y, 250)
+                    self.spawn_score_popup(human.pos_x, human.pos_y, 250)
                     self.sfx.play("human_pick")
                     break
         else:
             carried = self.player.held_human
             if carried:
-                ground_target = terrain_height(carried.world_pos.x) - carried.rect.height / 2
-                if self.player.world_pos.y >= ground_target - 12:
+                ground_target = terrain_height(carried.pos_x) - HUMAN_HALF_HEIGHT
+                if self.player.pos_y >= ground_target - 12:
                     delivered = self.player.deliver_human()
                     if delivered:
                         self.player.score += 250
-                        self.spawn_score_popup(delivered.world_pos.x, delivered.world_pos.y, 250)
+                        self.spawn_score_popup(delivered.pos_x, delivered.pos_y, 250)
                         self.sfx.play("human_drop")
 
     def colonist_safe_landing(self, human: "Human"):
@@ -2264,7 +3104,7 @@ class DefenderGame:
             return
         if self.player:
             self.player.score += 250
-        self.spawn_score_popup(human.world_pos.x, human.world_pos.y, 250)
+        self.spawn_score_popup(human.pos_x, human.pos_y, 250)
         self.sfx.play("human_drop")
         human.safe_landing_rewarded = True
 
@@ -2277,11 +3117,7 @@ class DefenderGame:
                 y,
                 velocity,
                 ttl=1.6,
-                colors=[
-                    (255, 240, 140),
-                    (255, 180, 90),
-                    (255, 80, 80),
-                ],
+                colors=PLAYER_EXPLOSION_COLORS,
                 length=24,
                 thickness=4,
                 anchor="center",
@@ -2298,11 +3134,7 @@ class DefenderGame:
                 y,
                 velocity,
                 ttl=0.9,
-                colors=[
-                    (255, 180, 120),
-                    (255, 160, 80),
-                    (120, 80, 40),
-                ],
+                colors=COLONIST_CRATER_COLORS,
                 length=14,
                 thickness=3,
                 anchor="center",
@@ -2337,7 +3169,7 @@ class DefenderGame:
         self.player.invulnerable = PLAYER_RESPAWN_INVULN + PLAYER_DEATH_INVULN
 
     def demo_blank_input(self) -> dict[int, bool]:
-        return {key: False for key in DEMO_CONTROL_KEYS}
+        return _DEMO_BLANK_INPUT.copy()
 
     def start_demo(self):
         if self.demo_active:
@@ -2345,10 +3177,11 @@ class DefenderGame:
         self.demo_prev_no_death = self.no_death
         self.demo_sound_enabled = self.sfx.enabled
         self.demo_active = True
-        self.state = "demo"
+        self.state = GAME_DEMO
         self.title_timer = 0.0
         self.demo_stage = "prime_capture"
         self.demo_stage_timer = 0.0
+        self.demo_fire_clock = 0.0
         self.demo_target_lander = None
         self.demo_target_human = None
         self.demo_mutant_observed = False
@@ -2359,6 +3192,129 @@ class DefenderGame:
         if self.player:
             self.player.demo_input = self.demo_blank_input()
 
+    def nearest_lander(self, reference_x: float) -> Optional["Lander"]:
+        if not self.landers:
+            return None
+        return min(self.landers, key=lambda l: abs(shortest_offset(l.pos_x, reference_x)))
+
+    # Demo stages: each steers via move_vector, may advance demo_stage, and
+    # returns whether the pilot should fire this frame.
+    def _demo_prime_capture(self, player: Player, move_vector: pygame.math.Vector2) -> bool:
+        if not self.demo_target_human or self.demo_target_human.state in (HUMAN_DEAD, HUMAN_CAPTURED):
+            ground_humans = [h for h in self.humans if h.state == HUMAN_GROUND]
+            self.demo_target_human = random.choice(ground_humans) if ground_humans else None
+            self.demo_stage_timer = 0.0
+
+        if self.demo_target_human:
+            _seek(player, move_vector, self.demo_target_human.pos_x, PLAYFIELD_TOP + 150, weight=0.6)
+            if not self.demo_target_lander or not self.demo_target_lander.alive():
+                self.demo_target_lander = self.nearest_lander(self.demo_target_human.pos_x)
+            if self.demo_target_lander and self.demo_target_human.state == HUMAN_GROUND:
+                self.demo_target_human.reserve_for_lander(self.demo_target_lander)
+            if self.demo_target_human.state == HUMAN_CAPTURED:
+                self.demo_stage = "rescue"
+                self.demo_stage_timer = 0.0
+        else:
+            _seek(player, move_vector, player.pos_x, PLAYFIELD_TOP + 150, weight=0.4, max_dx=120, max_dy=80)
+            if self.demo_stage_timer > 10.0:
+                self.demo_stage_timer = 0.0
+                self.spawn_wave_enemies()
+        return False
+
+    def _demo_rescue(self, player: Player, move_vector: pygame.math.Vector2) -> bool:
+        lander = self.demo_target_lander if self.demo_target_lander and self.demo_target_lander.alive() else None
+        if not lander:
+            self.demo_stage = "pickup"
+            self.demo_stage_timer = 0.0
+            return False
+        dx, dy = _seek(player, move_vector, lander.pos_x, lander.pos_y, weight=1.1, max_dx=160, max_dy=140)
+        close = abs(dx) < 140 and abs(dy) < 120
+        if not lander.alive() or (self.demo_target_human and self.demo_target_human.state == HUMAN_FALLING):
+            self.demo_stage = "pickup"
+            self.demo_stage_timer = 0.0
+        return close
+
+    def _demo_pickup(self, player: Player, move_vector: pygame.math.Vector2) -> bool:
+        human = self.demo_target_human
+        if not human or human.state == HUMAN_DEAD:
+            self.demo_stage = "allow_mutate"
+            self.demo_stage_timer = 0.0
+            return False
+        target_y = human.pos_y - 20 if human.state == HUMAN_FALLING else human.pos_y - 10
+        _seek(player, move_vector, human.pos_x, target_y, weight=0.9, max_dx=120, max_dy=80)
+        if human.state == HUMAN_GROUND:
+            self.demo_stage = "allow_mutate"
+            self.demo_stage_timer = 0.0
+            self.demo_target_human = human
+        elif player.held_human:
+            self.demo_stage = "deliver"
+            self.demo_stage_timer = 0.0
+        return False
+
+    def _demo_deliver(self, player: Player, move_vector: pygame.math.Vector2) -> bool:
+        human = self.demo_target_human
+        if not human:
+            self.demo_stage = "allow_mutate"
+            self.demo_stage_timer = 0.0
+            return False
+        drop_x = human.pos_x
+        ground_y = terrain_height(drop_x) - 24
+        dx, dy = _seek(player, move_vector, drop_x, ground_y, weight=1.0, max_dx=100, max_dy=80)
+        if dy > 0:
+            move_vector.y += 0.6
+        if not player.held_human and human.state == HUMAN_GROUND:
+            self.demo_stage = "allow_mutate"
+            self.demo_stage_timer = 0.0
+            self.demo_target_lander = None
+            self.demo_target_human = None
+        return False
+
+    def _demo_allow_mutate(self, player: Player, move_vector: pygame.math.Vector2) -> bool:
+        _seek(player, move_vector, player.pos_x, PLAYFIELD_TOP + 120, weight=0.3, max_dx=160, max_dy=120)
+        if not self.demo_target_human or self.demo_target_human.state == HUMAN_DEAD:
+            ground_humans = [h for h in self.humans if h.state == HUMAN_GROUND]
+            self.demo_target_human = random.choice(ground_humans) if ground_humans else None
+            self.demo_stage_timer = 0.0
+        if self.demo_target_human and self.demo_target_human.state == HUMAN_CAPTURED:
+            self.demo_target_lander = self.demo_target_human.carrier
+        if self.demo_target_human and self.demo_target_human.state == HUMAN_GROUND:
+            if not self.demo_target_lander or not self.demo_target_lander.alive():
+                self.demo_target_lander = self.nearest_lander(self.demo_target_human.pos_x)
+            if self.demo_target_lander:
+                self.demo_target_human.reserve_for_lander(self.demo_target_lander)
+        if self.demo_target_lander and not self.demo_target_lander.alive():
+            self.demo_target_lander = None
+        if not self.landers:
+            self.spawn_wave_enemies()
+        if self.demo_target_lander and self.demo_target_lander.alive():
+            offset_dir = 1 if shortest_offset(self.demo_target_lander.pos_x, player.pos_x) < 0 else -1
+            # _seek takes the wrapped offset itself, so safe_x needs no wrap here.
+            safe_x = self.demo_target_lander.pos_x + offset_dir * 260
+            _seek(player, move_vector, safe_x, PLAYFIELD_TOP + 140, weight=0.6)
+        if self.demo_mutant_observed:
+            self.demo_stage = "finished"
+            self.demo_stage_timer = 0.0
+            self.demo_mutant_observed = False
+        return False
+
+    def _demo_finished(self, player: Player, move_vector: pygame.math.Vector2) -> bool:
+        _seek(player, move_vector, player.pos_x, PLAYFIELD_TOP + 140, weight=0.4, max_dx=160, max_dy=120)
+        if self.demo_stage_timer > 8.0:
+            self.demo_stage = "prime_capture"
+            self.demo_stage_timer = 0.0
+            self.demo_target_human = None
+            self.demo_target_lander = None
+        return False
+
+    _DEMO_STAGES = {
+        "prime_capture": _demo_prime_capture,
+        "rescue": _demo_rescue,
+        "pickup": _demo_pickup,
+        "deliver": _demo_deliver,
+        "allow_mutate": _demo_allow_mutate,
+        "finished": _demo_finished,
+    }
+
     def update_demo(self, dt: float):
         if not self.player:
             return
@@ -2368,170 +3324,80 @@ class DefenderGame:
             self.demo_stage_timer = 0.0
 
         self.demo_stage_timer += dt
+        self.demo_fire_clock = (self.demo_fire_clock + dt) % DEMO_FIRE_CYCLE
         player = self.player
         move_vector = pygame.math.Vector2(0, 0)
-        fire = False
-
-        def seek(target_x: float, target_y: float, weight: float = 1.0, max_dx: float = 180.0, max_dy: float = 120.0) -> tuple[float, float]:
-            dx = shortest_offset(target_x, player.world_pos.x)
-            dy = target_y - player.world_pos.y
-            if max_dx > 0:
-                move_vector.x += weight * clamp(dx / max_dx, -1.0, 1.0)
-            if max_dy > 0:
-                move_vector.y += weight * clamp(dy / max_dy, -1.0, 1.0)
-            return dx, dy
-
-        def nearest_lander(reference_x: float) -> Optional["Lander"]:
-            landers = [enemy for enemy in self.enemies if isinstance(enemy, Lander)]
-            if not landers:
-                return None
-            return min(landers, key=lambda l: abs(shortest_offset(l.world_pos.x, reference_x)))
-
-        if self.demo_stage == "prime_capture":
-            if not self.demo_target_human or self.demo_target_human.state in ("dead", "captured"):
-                ground_humans = [h for h in self.humans if h.state == "ground"]
-                self.demo_target_human = random.choice(ground_humans) if ground_humans else None
-                self.demo_stage_timer = 0.0
-
-            if self.demo_target_human:
-                seek(self.demo_target_human.world_pos.x, PLAYFIELD_TOP + 150, weight=0.6)
-                if not self.demo_target_lander or not self.demo_target_lander.alive():
-                    self.demo_target_lander = nearest_lander(self.demo_target_human.world_pos.x)
-                if self.demo_target_lander and self.demo_target_human.state == "ground":
-                    self.demo_target_human.reserve_for_lander(self.demo_target_lander)
-                if self.demo_target_human.state == "captured":
-                    self.demo_stage = "rescue"
-                    self.demo_stage_timer = 0.0
-            else:
-                seek(player.world_pos.x, PLAYFIELD_TOP + 150, weight=0.4, max_dx=120, max_dy=80)
-                if self.demo_stage_timer > 10.0:
-                    self.demo_stage_timer = 0.0
-                    self.spawn_wave_enemies()
-
-        elif self.demo_stage == "rescue":
-            lander = self.demo_target_lander if self.demo_target_lander and self.demo_target_lander.alive() else None
-            if not lander:
-                self.demo_stage = "pickup"
-                self.demo_stage_timer = 0.0
-            else:
-                dx, dy = seek(lander.world_pos.x, lander.world_pos.y, weight=1.1, max_dx=160, max_dy=140)
-                close = abs(dx) < 140 and abs(dy) < 120
-                fire = close
-                if not lander.alive() or (self.demo_target_human and self.demo_target_human.state == "falling"):
-                    self.demo_stage = "pickup"
-                    self.demo_stage_timer = 0.0
-
-        elif self.demo_stage == "pickup":
-            human = self.demo_target_human
-            if not human or human.state == "dead":
-                self.demo_stage = "allow_mutate"
-                self.demo_stage_timer = 0.0
-            else:
-                target_y = human.world_pos.y - 20 if human.state == "falling" else human.world_pos.y - 10
-                seek(human.world_pos.x, target_y, weight=0.9, max_dx=120, max_dy=80)
-                if human.state == "ground":
-                    self.demo_stage = "allow_mutate"
-                    self.demo_stage_timer = 0.0
-                    self.demo_target_human = human
-                elif player.held_human:
-                    self.demo_stage = "deliver"
-                    self.demo_stage_timer = 0.0
-
-        elif self.demo_stage == "deliver":
-            human = self.demo_target_human
-            if not human:
-                self.demo_stage = "allow_mutate"
-                self.demo_stage_timer = 0.0
-            else:
-                drop_x = human.world_pos.x
-                ground_y = terrain_height(drop_x) - 24
-                dx, dy = seek(drop_x, ground_y, weight=1.0, max_dx=100, max_dy=80)
-                if dy > 0:
-                    move_vector.y += 0.6
-                if not player.held_human and human.state == "ground":
-                    self.demo_stage = "allow_mutate"
-                    self.demo_stage_timer = 0.0
-                    self.demo_target_lander = None
-                    self.demo_target_human = None
-
-        elif self.demo_stage == "allow_mutate":
-            fire = False
-            seek(player.world_pos.x, PLAYFIELD_TOP + 120, weight=0.3, max_dx=160, max_dy=120)
-            if not self.demo_target_human or self.demo_target_human.state == "dead":
-                ground_humans = [h for h in self.humans if h.state == "ground"]
-                self.demo_target_human = random.choice(ground_humans) if ground_humans else None
-                self.demo_stage_timer = 0.0
-            if self.demo_target_human and self.demo_target_human.state == "captured":
-                self.demo_target_lander = self.demo_target_human.carrier
-            if self.demo_target_human and self.demo_target_human.state == "ground":
-                if not self.demo_target_lander or not self.demo_target_lander.alive():
-                    self.demo_target_lander = nearest_lander(self.demo_target_human.world_pos.x)
-                if self.demo_target_lander:
-                    self.demo_target_human.reserve_for_lander(self.demo_target_lander)
-            if self.demo_target_lander and not self.demo_target_lander.alive():
-                self.demo_target_lander = None
-            if not any(isinstance(enemy, Lander) for enemy in self.enemies):
-                self.spawn_wave_enemies()
-            if self.demo_target_lander and self.demo_target_lander.alive():
-                offset_dir = 1 if shortest_offset(self.demo_target_lander.world_pos.x, player.world_pos.x) < 0 else -1
-                safe_x = wrap_position(self.demo_target_lander.world_pos.x + offset_dir * 260)
-                seek(safe_x, PLAYFIELD_TOP + 140, weight=0.6)
-            if self.demo_mutant_observed:
-                self.demo_stage = "finished"
-                self.demo_stage_timer = 0.0
-                self.demo_mutant_observed = False
-
-        elif self.demo_stage == "finished":
-            fire = False
-            seek(player.world_pos.x, PLAYFIELD_TOP + 140, weight=0.4, max_dx=160, max_dy=120)
-            if self.demo_stage_timer > 8.0:
-                self.demo_stage = "prime_capture"
-                self.demo_stage_timer = 0.0
-                self.demo_target_human = None
-                self.demo_target_lander = None
 
+        stage = self._DEMO_STAGES.get(self.demo_stage)
+        if stage is not None:
+            fire = stage(self, player, move_vector)
         else:
+            fire = False
             self.demo_stage = "prime_capture"
             self.demo_stage_timer = 0.0
 
-        # Threat avoidance
-        avoid = pygame.math.Vector2(0, 0)
-        for shot in self.enemy_shots:
-            offset = pygame.math.Vector2(shortest_offset(shot.world_pos.x, player.world_pos.x), shot.world_pos.y - player.world_pos.y)
-            dist = offset.length()
-            if dist and dist < 180:
-                avoid -= offset.normalize() * (1.4 - dist / 180)
-
+        # Threat avoidance. Only shots within 180px matter, so look them up in the
+        # shot hash from the last collision pass: no shot or camera has moved
+        # since, and shots killed in between are skipped via alive(). The query
+        # is centred on the player's position, as a respawn may have moved it.
+        # Each threat pushes away along its unit offset, so scale the raw offset
+        # by push / dist instead of building and normalising a Vector2.
+        px, py = player.pos_x, player.pos_y
+        avoid_x = avoid_y = 0.0
+        reach = pygame.Rect(0, 0, 2 * DEMO_SHOT_AVOID_REACH, 2 * DEMO_SHOT_AVOID_REACH)
+        reach.center = (int(world_to_screen(px, self.camera_x)), int(py))
+        for shot in self.shot_hash.query(reach):
+            if not shot.alive():
+                continue
+            dx = shortest_offset(shot.pos_x, px)
+            dy = shot.pos_y - py
+            dist_sq = dx * dx + dy * dy
+            if 0 < dist_sq < 180 * 180:
+                dist = math.sqrt(dist_sq)
+                scale = (1.4 - dist / 180) / dist
+                avoid_x -= dx * scale
+                avoid_y -= dy * scale
+
+        target_lander = self.demo_target_lander
         for enemy in self.enemies:
-            if isinstance(enemy, Lander) and enemy is self.demo_target_lander:
+            if enemy is target_lander:
                 continue
-            offset = pygame.math.Vector2(shortest_offset(enemy.world_pos.x, player.world_pos.x), enemy.world_pos.y - player.world_pos.y)
-            dist = offset.length()
-            if dist and dist < 200:
-                avoid -= offset.normalize() * (1.2 - dist / 200)
-
-        move_vector += avoid
+            # Reject on height first; it needs no wrapped X offset.
+            dy = enemy.pos_y - py
+            if dy >= 200 or dy <= -200:
+                continue
+            dx = shortest_offset(enemy.pos_x, px)
+            dist_sq = dx * dx + dy * dy
+            if 0 < dist_sq < 200 * 200:
+                dist = math.sqrt(dist_sq)
+                scale = (1.2 - dist / 200) / dist
+                avoid_x -= dx * scale
+                avoid_y -= dy * scale
+
+        move_vector.x += avoid_x
+        move_vector.y += avoid_y
         move_vector.x = clamp(move_vector.x, -1.5, 1.5)
         move_vector.y = clamp(move_vector.y, -1.5, 1.5)
 
         commands = self.demo_blank_input()
         if move_vector.x > 0.18:
-            commands[pygame.K_RIGHT] = True
+            commands[_K_RIGHT] = True
         elif move_vector.x < -0.18:
-            commands[pygame.K_LEFT] = True
+            commands[_K_LEFT] = True
         if move_vector.y > 0.18:
-            commands[pygame.K_DOWN] = True
+            commands[_K_DOWN] = True
         elif move_vector.y < -0.18:
-            commands[pygame.K_UP] = True
+            commands[_K_UP] = True
 
-        if not fire and (pygame.time.get_ticks() // 300) % 3 == 0:
+        # Heartbeat: fire through the first third of every cycle.
+        if not fire and self.demo_fire_clock < DEMO_FIRE_CYCLE / 3:
             fire = True
-        commands[pygame.K_SPACE] = fire
+        commands[_K_SPACE] = fire
         self.player.demo_input = commands
 
     def stop_demo(self):
-        if not self.demo_active and self.state != "demo":
-            self.state = "title"
+        if not self.demo_active and self.state != GAME_DEMO:
+            self.state = GAME_TITLE
             self.title_timer = 0.0
             return
         self.demo_active = False
@@ -2541,14 +3407,13 @@ class DefenderGame:
         self.demo_mutant_observed = False
         self.no_death = self.demo_prev_no_death
         self.sfx.enabled = self.demo_sound_enabled
-        self.state = "title"
+        self.state = GAME_TITLE
         self.title_timer = 0.0
         self.setup_world()
 
     def transform_landers(self):
-        for enemy in list(self.enemies):
-            if isinstance(enemy, Lander):
-                enemy.mutate()
+        for lander in self.landers.sprites():
+            lander.mutate()
         if not self.ground_destroyed:
             self.ground_destroyed = True
             self.spawn_ground_eruption()
@@ -2560,39 +3425,63 @@ class DefenderGame:
         self.screen.fill((10, 10, 30))
         self.starfield.draw(self.screen, self.camera_x)
 
-        # Update rects before drawing/collision.
+        # Projectiles are batched by draw_projectiles. They only move or spawn inside
+        # the update pass, which projects them (pooled shots in one batch), and the
+        # camera never moves after it, so their rects are already current.
+        projectiles = {**self.lasers.spritedict, **self.enemy_shots.spritedict}
+        hidden = {human for human in self.humans if not human.visible}
+        player = self.player
+        camera_x = self.camera_x
+        batch = []
+        queue = batch.append
+        # Everything else may have moved or spawned after the pass, so refresh its rect.
+        # The player is matched by identity; the rest is queued in group order for one blits call.
         for sprite in self.all_sprites:
-            sprite.update_rect(self.camera_x)
-            if isinstance(sprite, Player):
+            if sprite in projectiles:
+                continue
+            sprite.update_rect(camera_x)
+            if sprite is player:
                 if not sprite.render_visible:
                     continue
                 if sprite.invulnerable > 0:
                     alpha = 150 + int(105 * math.sin(pygame.time.get_ticks() * 0.02))
-                    temp = sprite.image.copy()
-                    temp.set_alpha(alpha)
-                    self.screen.blit(temp, sprite.rect)
+                    # Ship frames are shared, so pulse a private copy of each one.
+                    pulse = self.player_pulse_frames.get(sprite.image)
+                    if pulse is None:
+                        pulse = self.player_pulse_frames[sprite.image] = sprite.image.copy()
+                    pulse.set_alpha(alpha)
+                    queue((pulse, sprite.rect))
                 else:
-                    self.screen.blit(sprite.image, sprite.rect)
-            elif isinstance(sprite, Human) and not sprite.visible:
-                continue
-            else:
-                self.screen.blit(sprite.image, sprite.rect)
-
-        if self.state in ("playing", "game_over"):
+                    queue((sprite.image, sprite.rect))
+            elif sprite not in hidden:
+                queue((sprite.image, sprite.rect))
+        if batch:
+            self.screen.blits(batch, doreturn=False)
+        self.draw_projectiles(self.screen)
+        self.ground_particles.draw(self.screen, self.camera_x)
+        self.hyperspace_debris.draw(self.screen, self.camera_x)
+
+        if self.state in (GAME_PLAYING, GAME_OVER):
             self.draw_ground()
             self.draw_hud()
-            if self.state == "game_over":
+            if self.state == GAME_OVER:
                 self.draw_game_over()
             elif self.message_timer:
                 self.draw_hint()
         else:
             self.draw_ground()
-            title_text = self.big_font.render("DEFENDER", True, (255, 200, 80))
-            prompt = self.font.render("Press Enter to start", True, (200, 255, 200))
-            hint = self.font.render("WASD/Arrows move · Space fire · Shift turn · B bomb · H hyperspace", True, (180, 200, 255))
-            status = self.font.render(
+            title_text = self.render_text("title", self.big_font, "DEFENDER", (255, 200, 80))
+            prompt = self.render_text("title_prompt", self.font, "Press Enter to start", (200, 255, 200))
+            hint = self.render_text(
+                "title_hint",
+                self.font,
+                "WASD/Arrows move · Space fire · Shift turn · B bomb · H hyperspace",
+                (180, 200, 255),
+            )
+            status = self.render_text(
+                "title_status",
+                self.font,
                 "Demo mode" if self.demo_active else "Waiting...",
-                True,
                 (180, 200, 255),
             )
             self.screen.blit(title_text, title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80)))
@@ -2602,23 +3491,44 @@ class DefenderGame:
 
         pygame.display.flip()
 
+    def draw_projectiles(self, surface: pygame.Surface):
+        """Blit every on-screen laser, enemy shot and mine in a single batch."""
+        view = surface.get_rect()
+        onscreen = view.colliderect
+        batch = [
+            (projectile.image, projectile.rect)
+            for group in (self.lasers, self.enemy_shots)
+            for projectile in group
+            if onscreen(projectile.rect)
+        ]
+        if batch:
+            surface.blits(batch, doreturn=False)
+
     def draw_ground(self):
         if self.ground_destroyed:
             return
-        terrain_points = []
-        half_width = SCREEN_WIDTH / 2
-        for screen_x in range(0, SCREEN_WIDTH + 4, 4):
-            world_x = wrap_position(self.camera_x + (screen_x - half_width))
-            y = int(terrain_height(world_x))
-            terrain_points.append((screen_x, y))
-
-        if not terrain_points:
-            return
-
-        # Base glow pass to suggest the scanner outline.
-        pygame.draw.lines(self.screen, (40, 110, 60), False, terrain_points, 6)
+        points = self.ground_points
+        # Assigning floats into the int column truncates, like int().
+        points[:, 1] = terrain_height_batch(self.camera_x + _GROUND_OFFSETS)
+        terrain_points = points.tolist()
+
+        # Base glow pass to suggest the scanner outline. The wide, dim stroke hides
+        # its own sampling, so it takes every other point, keeping the right edge.
+        glow_points = terrain_points[::2]
+        if (len(terrain_points) - 1) % 2:
+            glow_points.append(terrain_points[-1])
+        pygame.draw.lines(self.screen, (40, 110, 60), False, glow_points, 6)
         pygame.draw.lines(self.screen, (90, 220, 120), False, terrain_points, 2)
 
+    def render_text(self, slot: str, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render `text` for a fixed HUD slot, reusing the last surface while the text is unchanged."""
+        cached = self.text_cache.get(slot)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surface = font.render(text, True, color)
+        self.text_cache[slot] = (text, surface)
+        return surface
+
     def draw_hud(self):
         if not self.player:
             return
@@ -2632,52 +3542,51 @@ class DefenderGame:
         center = pygame.Rect(panel_rect.left + third + 6, panel_rect.top + 8, third - 12, panel_rect.height - 16)
         right = pygame.Rect(panel_rect.left + 2 * third + 8, panel_rect.top + 8, third - 16, panel_rect.height - 16)
 
-        score_text = self.big_font.render(f"{self.player.score:06d}", True, (255, 255, 140))
+        score_text = self.render_text("score", self.big_font, f"{self.player.score:06d}", (255, 255, 140))
         self.screen.blit(score_text, (left.left, left.top))
 
         line_y = left.top + score_text.get_height() + 4
-        for i in range(max(0, self.player.lives)):
-            offset = i * (LIFE_ICON_SURFACE.get_width() + 4)
-            self.screen.blit(LIFE_ICON_SURFACE, (left.left + offset, line_y))
+        if self.player.lives > 0:
+            self.screen.blit(create_lives_row(self.player.lives), (left.left, line_y))
         line_y += LIFE_ICON_SURFACE.get_height() + 4
 
-        colonists = sum(1 for h in self.humans if h.state != "dead")
-        colonist_text = self.font.render(f"Colonists {colonists}/{len(self.humans)}", True, (200, 255, 200))
+        colonists = sum(1 for h in self.humans if h.state != HUMAN_DEAD)
+        colonist_text = self.render_text("colonists", self.font, f"Colonists {colonists}/{len(self.humans)}", (200, 255, 200))
         self.screen.blit(colonist_text, (left.left, line_y))
         line_y += colonist_text.get_height() + 2
 
         pygame.draw.rect(self.screen, (0, 200, 80), center, 2)
         self.draw_scanner(center)
 
-        wave_text = self.font.render(f"Wave {self.wave}", True, (220, 255, 220))
+        wave_text = self.render_text("wave", self.font, f"Wave {self.wave}", (220, 255, 220))
         self.screen.blit(wave_text, (right.left, right.top))
         info_y = right.top + wave_text.get_height() + 6
         if self.no_death:
-            status = self.font.render("NO-DEATH", True, (255, 120, 255))
+            status = self.render_text("no_death", self.font, "NO-DEATH", (255, 120, 255))
             self.screen.blit(status, (right.left, info_y))
             info_y += status.get_height() + 4
 
-        bomb_text = self.font.render(f"Smart Bombs {self.smart_bombs}", True, (255, 240, 160))
+        bomb_text = self.render_text("smart_bombs", self.font, f"Smart Bombs {self.smart_bombs}", (255, 240, 160))
         self.screen.blit(bomb_text, (right.left, info_y))
         info_y += bomb_text.get_height() + 4
 
         if self.hyperspace_cooldown > 0:
-            hyper_text = self.font.render(f"Hyperspace {self.hyperspace_cooldown:0.1f}s", True, (180, 220, 255))
+            hyper_text = self.render_text("hyperspace", self.font, f"Hyperspace {self.hyperspace_cooldown:0.1f}s", (180, 220, 255))
             self.screen.blit(hyper_text, (right.left, info_y))
 
     def draw_hint(self):
         if not self.player:
             return
         hint = self.wave_message or DEFAULT_HINT
-        text = self.font.render(hint, True, (255, 255, 180))
+        text = self.render_text("hint", self.font, hint, (255, 255, 180))
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, HUD_HEIGHT + 24))
         self.screen.blit(text, rect)
 
     def draw_game_over(self):
-        text = self.big_font.render("GAME OVER", True, (255, 120, 120))
+        text = self.render_text("game_over", self.big_font, "GAME OVER", (255, 120, 120))
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(text, rect)
-        prompt = self.font.render("Press Enter to restart", True, (255, 255, 220))
+        prompt = self.render_text("game_over_prompt", self.font, "Press Enter to restart", (255, 255, 220))
         prect = prompt.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         self.screen.blit(prompt, prect)
 
@@ -2690,7 +3599,7 @@ class DefenderGame:
                 y,
                 pygame.math.Vector2(random.uniform(-120, 120), random.uniform(-120, 120)),
                 ttl=0.28,
-                colors=[(255, 200, 120), (255, 160, 80), (255, 240, 200)],
+                colors=EXPLOSION_SPARK_COLORS,
                 length=18,
                 thickness=3,
                 anchor="center",
@@ -2710,12 +3619,22 @@ class DefenderGame:
 
     def spawn_ground_eruption(self):
         samples = max(GROUND_ERUPTION_PARTICLE_COUNT // 6, 1)
+        per_sample = GROUND_ERUPTION_PARTICLE_COUNT // samples
+        palette = np.array(GROUND_ERUPTION_PARTICLE_COLORS, dtype=np.uint8)
         for i in range(samples):
             world_x = random.uniform(0, WORLD_WIDTH)
             y = terrain_height(world_x)
-            for _ in range(GROUND_ERUPTION_PARTICLE_COUNT // samples):
-                particle = GroundParticle(world_x, y)
-                self.all_sprites.add(particle)
+            angle = np.random.uniform(-math.pi * 0.4, math.pi * 0.4, per_sample)
+            speed = np.random.uniform(160, 340, per_sample)
+            self.ground_particles.emit(
+                world_x,
+                y,
+                speed * np.cos(angle),
+                speed * np.sin(angle),
+                GROUND_ERUPTION_TTL + np.random.uniform(-0.3, 0.3, per_sample),
+                np.random.randint(3, 7, per_sample),
+                palette[np.random.randint(0, len(palette), per_sample)],
+            )
 
     def draw_scanner(self, rect: pygame.Rect):
         if not self.player:
@@ -2725,7 +3644,7 @@ class DefenderGame:
         pygame.draw.rect(self.screen, (0, 20, 0), inner)
         pygame.draw.rect(self.screen, (0, 160, 60), rect, 2)
 
-        player_x = self.player.world_pos.x
+        player_x = self.player.pos_x
         scan_half = inner.width / 2
         center_x = inner.centerx
         play_height = max(1.0, SCREEN_HEIGHT - PLAYFIELD_TOP)
@@ -2744,22 +3663,29 @@ class DefenderGame:
             4,
         )
 
-        terrain_points = []
-        for i in range(inner.left, inner.right, 3):
-            offset = (i - center_x) / scan_half
-            world_x = wrap_position(player_x + offset * (WORLD_WIDTH / 2))
-            ground = terrain_height(world_x)
-            ratio = clamp((ground - PLAYFIELD_TOP) / play_height, 0.0, 1.0)
-            y = top_limit + ratio * (baseline - top_limit)
-            terrain_points.append((i, int(y)))
-        if len(terrain_points) > 1 and not self.radar_ground_destroyed:
-            pygame.draw.lines(self.screen, (255, 160, 40), False, terrain_points, 2)
-
-        def draw_marker(entity_pos: pygame.math.Vector2, color: tuple[int, int, int], radius: int = 3):
-            dx = shortest_offset(entity_pos.x, player_x) / (WORLD_WIDTH / 2)
+        # Nothing of the trace survives a planet eruption, so skip the sampling too.
+        if not self.radar_ground_destroyed:
+            # The scanner rect is fixed by the HUD layout, so the sample columns and
+            # the point buffer are only rebuilt if it ever changes.
+            points = self.scanner_points
+            if self.scanner_span != (inner.left, inner.right):
+                self.scanner_span = (inner.left, inner.right)
+                sample_xs = np.arange(inner.left, inner.right, 3)
+                points = self.scanner_points = np.column_stack((sample_xs, np.zeros_like(sample_xs)))
+                self.scanner_offsets = (sample_xs - center_x) / scan_half * (WORLD_WIDTH / 2)
+            grounds = terrain_height_batch(player_x + self.scanner_offsets)
+            ratios = np.clip((grounds - PLAYFIELD_TOP) / play_height, 0.0, 1.0)
+            # Assigning floats into the int column truncates, like int().
+            points[:, 1] = top_limit + ratios * (baseline - top_limit)
+            terrain_points = points.tolist()
+            if len(terrain_points) > 1:
+                pygame.draw.lines(self.screen, (255, 160, 40), False, terrain_points, 2)
+
+        def draw_marker(entity_x: float, entity_y: float, color: tuple[int, int, int], radius: int = 3):
+            dx = shortest_offset(entity_x, player_x) / (WORLD_WIDTH / 2)
             dx = clamp(dx, -1.0, 1.0)
             scanner_x = center_x + dx * scan_half
-            ratio = clamp((entity_pos.y - PLAYFIELD_TOP) / play_height, 0.0, 1.0)
+            ratio = clamp((entity_y - PLAYFIELD_TOP) / play_height, 0.0, 1.0)
             scanner_y = top_limit + ratio * (baseline - top_limit)
             pygame.draw.circle(self.screen, color, (int(scanner_x), int(scanner_y)), radius)
 
@@ -2776,13 +3702,18 @@ class DefenderGame:
                 color = (255, 255, 255)
             else:
                 color = (120, 255, 140)
-            draw_marker(enemy.world_pos, color, radius=4 if not isinstance(enemy, Swarmer) else 3)
+            draw_marker(enemy.pos_x, enemy.pos_y, color, radius=4 if not isinstance(enemy, Swarmer) else 3)
 
         for human in self.humans:
-            if human.state != "dead":
-                draw_marker(human.world_pos, (120, 200, 255), radius=2)
+            if human.state != HUMAN_DEAD:
+                draw_marker(human.pos_x, human.pos_y, (120, 200, 255), radius=2)
 
     def run(self):
+        # The loop below only reacts to these; block everything else (mouse motion,
+        # window and text events) at SDL level so it never reaches the queue.
+        # Held keys are read from get_pressed(), which SDL updates regardless.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         running = True
         while running:
             dt = self.clock.tick(FPS) / 1000.0
@@ -2792,20 +3723,20 @@ class DefenderGame:
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
-                    elif self.player and self.state == "playing" and event.key in (pygame.K_LSHIFT, pygame.K_RSHIFT):
+                    elif self.player and self.state == GAME_PLAYING and event.key in (pygame.K_LSHIFT, pygame.K_RSHIFT):
                         self.player.begin_reverse_traverse()
-                    elif self.state == "playing" and event.key == SMART_BOMB_KEY:
+                    elif self.state == GAME_PLAYING and event.key == SMART_BOMB_KEY:
                         self.activate_smart_bomb()
-                    elif self.state == "playing" and event.key == HYPERSPACE_KEY:
+                    elif self.state == GAME_PLAYING and event.key == HYPERSPACE_KEY:
                         self.activate_hyperspace()
                     elif event.key == pygame.K_0:
                         self.no_death = not self.no_death
                     if event.key == pygame.K_RETURN:
-                        if self.state == "demo":
+                        if self.state == GAME_DEMO:
                             self.stop_demo()
-                        elif self.state in ("title", "game_over"):
+                        elif self.state in (GAME_TITLE, GAME_OVER):
                             self.stop_demo()
-                            self.state = "playing"
+                            self.state = GAME_PLAYING
                             self.title_timer = 0.0
                             self.demo_active = False
                             self.setup_world()